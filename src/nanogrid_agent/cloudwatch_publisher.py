@@ -4,9 +4,13 @@ CloudWatch 메트릭 발행 서비스
 실행 메트릭을 AWS CloudWatch로 전송
 """
 
-from datetime import datetime
+import asyncio
+import atexit
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
 
-import boto3
 import structlog
 
 from .config import AgentConfig
@@ -14,22 +18,80 @@ from .config import AgentConfig
 
 logger = structlog.get_logger()
 
+# 프로세스 전역 boto3 세션 / 리전별 클라이언트 캐시 (botocore 서비스 모델 로딩 1회)
+# boto3 import 비용이 크므로 첫 클라이언트 생성 시점에 lazy 초기화
+_SESSION = None
+_CLIENT_CACHE: Dict[str, Any] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _get_cloudwatch_client(region: str) -> Any:
+    """리전별 CloudWatch 클라이언트 반환 (캐시)"""
+    global _SESSION
+
+    with _CLIENT_CACHE_LOCK:
+        client = _CLIENT_CACHE.get(region)
+        if client is None:
+            import boto3
+            from botocore.config import Config
+
+            if _SESSION is None:
+                _SESSION = boto3.Session()
+
+            # 전송 스레드 풀 크기에 맞춘 keep-alive 커넥션 풀 (요청마다 TLS 핸드셰이크 방지)
+            client = _SESSION.client(
+                "cloudwatch",
+                region_name=region,
+                config=Config(tcp_keepalive=True, max_pool_connections=2),
+            )
+            _CLIENT_CACHE[region] = client
+        return client
+
+
+@functools.lru_cache(maxsize=1024)
+def _dimensions(function_id: str, runtime: str) -> List[dict]:
+    """(function_id, runtime)별 Dimensions 리스트 (읽기 전용으로 공유)"""
+    return [
+        {"Name": "FunctionId", "Value": function_id},
+        {"Name": "Runtime", "Value": runtime},
+    ]
+
 
 class CloudWatchMetricsPublisher:
-    """CloudWatch 커스텀 메트릭 퍼블리셔"""
+    """
+    CloudWatch 커스텀 메트릭 퍼블리셔
+
+    메트릭을 버퍼에 모아두었다가 MAX_BATCH_SIZE에 도달하거나
+    FLUSH_INTERVAL_SECONDS가 지나면 한 번의 PutMetricData로 전송.
+    전송은 별도 스레드 풀에서 수행되어 호출자를 블로킹하지 않음
+    """
 
     NAMESPACE = "NanoGrid/FunctionRunner"
     METRIC_NAME_PEAK_MEMORY = "PeakMemoryBytes"
+    MAX_BATCH_SIZE = 1000  # PutMetricData 요청당 최대 datum 수
+    FLUSH_INTERVAL_SECONDS = 5.0
 
     def __init__(self, config: AgentConfig):
         self.config = config
-        self.client = boto3.client("cloudwatch", region_name=config.aws.region)
+        self.client = _get_cloudwatch_client(config.aws.region)
+
+        self._buffer: List[dict] = []
+        self._buffer_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cw-pub")
+
+        # 주기적으로 버퍼를 비우는 백그라운드 스레드
+        self._flush_thread = threading.Thread(
+            target=self._flush_loop, name="cw-flush", daemon=True
+        )
+        self._flush_thread.start()
+        atexit.register(self.close)
 
     def publish_peak_memory(
         self, function_id: str, runtime: str, peak_memory_bytes: int
     ) -> None:
         """
-        피크 메모리 사용량을 CloudWatch에 전송
+        피크 메모리 사용량을 CloudWatch 전송 버퍼에 추가
 
         Args:
             function_id: 함수 ID
@@ -37,41 +99,83 @@ class CloudWatchMetricsPublisher:
             peak_memory_bytes: 피크 메모리 사용량 (바이트)
         """
         if peak_memory_bytes is None:
-            logger.debug("Peak memory is null, skipping CloudWatch publish")
-            return
-
-        try:
-            logger.info(
-                "Publishing peak memory metric to CloudWatch",
+            logger.debug(
+                "Peak memory is null, skipping CloudWatch publish",
                 function_id=function_id,
                 runtime=runtime,
-                bytes=peak_memory_bytes,
             )
+            return
 
-            self.client.put_metric_data(
-                Namespace=self.NAMESPACE,
-                MetricData=[
-                    {
-                        "MetricName": self.METRIC_NAME_PEAK_MEMORY,
-                        "Dimensions": [
-                            {"Name": "FunctionId", "Value": function_id},
-                            {"Name": "Runtime", "Value": runtime},
-                        ],
-                        "Timestamp": datetime.utcnow(),
-                        "Value": float(peak_memory_bytes),
-                        "Unit": "Bytes",
-                    }
-                ],
-            )
+        # 작업마다 호출되므로 DEBUG 레벨로 기록 (INFO 운영 환경에서는 렌더링 생략)
+        logger.debug(
+            "Queueing peak memory metric for CloudWatch",
+            function_id=function_id,
+            runtime=runtime,
+            bytes=peak_memory_bytes,
+        )
+
+        # Timestamp는 생략 - CloudWatch가 수신 시각으로 기록 (flush 주기 5초 이내 오차)
+        datum = {
+            "MetricName": self.METRIC_NAME_PEAK_MEMORY,
+            "Dimensions": _dimensions(function_id, runtime),
+            "Value": float(peak_memory_bytes),
+            "Unit": "Bytes",
+        }
+
+        batch = None
+        with self._buffer_lock:
+            self._buffer.append(datum)
+            if len(self._buffer) >= self.MAX_BATCH_SIZE:
+                batch, self._buffer = self._buffer, []
+
+        if batch:
+            # 네트워크 I/O는 호출자 스레드에서 분리 (fire-and-forget)
+            self._executor.submit(self._send, batch)
+
+    async def publish_peak_memory_async(
+        self, function_id: str, runtime: str, peak_memory_bytes: int
+    ) -> None:
+        """
+        이벤트 루프용 publish_peak_memory
+
+        버퍼 추가만 수행하며 네트워크 전송은 전송 스레드 풀에서 처리되므로
+        이벤트 루프를 블로킹하지 않음
+        """
+        self.publish_peak_memory(function_id, runtime, peak_memory_bytes)
+
+    async def flush_async(self) -> None:
+        """이벤트 루프를 블로킹하지 않고 버퍼 flush"""
+        await asyncio.to_thread(self.flush)
+
+    def flush(self) -> None:
+        """버퍼에 남아있는 메트릭을 즉시 전송"""
+        with self._buffer_lock:
+            batch, self._buffer = self._buffer, []
 
-            logger.info("Successfully published peak memory metric")
+        if batch:
+            self._send(batch)
+
+    def close(self) -> None:
+        """flush 스레드 중지, 남은 메트릭 전송 및 전송 스레드 풀 종료"""
+        self._stop_event.set()
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+    def _flush_loop(self) -> None:
+        """FLUSH_INTERVAL_SECONDS마다 버퍼 flush"""
+        while not self._stop_event.wait(self.FLUSH_INTERVAL_SECONDS):
+            self.flush()
+
+    def _send(self, batch: List[dict]) -> None:
+        """PutMetricData 호출 (배치 단위)"""
+        try:
+            self.client.put_metric_data(Namespace=self.NAMESPACE, MetricData=batch)
+            logger.info("Successfully published metrics", count=len(batch))
 
         except Exception as e:
             # CloudWatch 전송 실패는 메인 로직에 영향 없음
             logger.warning(
-                "Failed to publish metric to CloudWatch",
-                function_id=function_id,
-                runtime=runtime,
+                "Failed to publish metrics to CloudWatch",
+                count=len(batch),
                 error=str(e),
             )
-
@@ -4,33 +4,48 @@
 YAML 파일 또는 환경 변수에서 설정을 로드
 """
 
+import functools
+import hashlib
+import json
 import os
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
-import yaml
+# 파싱된 YAML 캐시: (절대경로, mtime_ns, size) -> dict
+_YAML_CACHE: Dict[Tuple[str, int, int], dict] = {}
+_YAML_CACHE_MAX_ENTRIES = 32
 
+# 설정은 로드 이후 변경되지 않으므로 frozen으로 선언
+# (dataclass slots 옵션은 Python 3.10+에서만 지원)
+_DATACLASS_OPTIONS = {"frozen": True}
+if sys.version_info >= (3, 10):
+    _DATACLASS_OPTIONS["slots"] = True
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class AwsConfig:
     region: str = "ap-northeast-2"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SqsConfig:
     queue_url: str = ""
     wait_time_seconds: int = 20
     max_number_of_messages: int = 10
+    visibility_timeout_seconds: int = 30  # 수신 시 지정하는 visibility timeout (처리 중에는 주기적으로 연장)
+    receiver_parallelism: int = 1  # 동시에 long polling하는 수신 스레드 수 (호출당 최대 10개 제한 우회)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class S3Config:
     code_bucket: str = ""
     user_data_bucket: str = ""
+    inmemory_threshold: int = 64 * 1024 * 1024  # 이 크기 이하의 코드 zip은 디스크를 거치지 않고 메모리에서 해제
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DockerConfig:
     python_image: str = "python-base"
     cpp_image: str = "gcc-base"
@@ -41,7 +56,7 @@ class DockerConfig:
     output_mount_path: str = "/output"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class WarmPoolConfig:
     enabled: bool = True
     python_size: int = 2
@@ -50,13 +65,16 @@ class WarmPoolConfig:
     go_size: int = 1
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class PollingConfig:
     enabled: bool = True
     fixed_delay_seconds: float = 1.0
+    worker_count: int = 8  # 동시에 처리하는 최대 메시지 수 (S3 다운로드, 결과 발행 등 I/O 단계)
+    docker_concurrency: int = 4  # 동시에 실행하는 최대 컨테이너 수 (호스트 CPU/메모리 기준)
+    prefetch_count: int = 0  # 처리 대기 중으로 미리 수신해 두는 최대 메시지 수 (0이면 sqs.max_number_of_messages × 3)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class RedisConfig:
     host: str = "127.0.0.1"
     port: int = 6379
@@ -64,14 +82,15 @@ class RedisConfig:
     result_prefix: str = "result:"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class OutputConfig:
     enabled: bool = True
     base_dir: str = "/tmp/output"
     s3_prefix: str = "outputs"
+    upload_concurrency: int = 16  # 동시 S3 업로드 파일 수
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class GcpConfig:
     """GCP Cloud Storage 설정"""
     enabled: bool = False
@@ -79,7 +98,135 @@ class GcpConfig:
     credentials_path: str = "/etc/gcp-key.json"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
+class FeaturesConfig:
+    """작업마다 추가 Docker 호출이 발생하는 부가 기능 설정"""
+    measure_memory: bool = True  # 피크 메모리 측정 (최적화 팁, CloudWatch 메트릭)
+    debug_workdir_ls: bool = True  # DEBUG 로그용 작업 디렉터리 ls 실행
+
+
+def _load_yaml_with_json_sidecar(path: str) -> dict:
+    """
+    YAML 파싱 결과를 `<path>.json` 사이드카로 캐시
+
+    사이드카에 원본 YAML의 SHA-256을 함께 저장하고, 현재 파일 내용과
+    정확히 일치할 때만 JSON(C 파서)으로 로드. 아니면 YAML을 파싱한 뒤 사이드카를 갱신
+    (mtime이 과거로 보존된 교체(rsync -t, cp -p 등)에도 오래된 사이드카를 사용하지 않음)
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw).hexdigest()
+
+    sidecar = f"{path}.json"
+    try:
+        with open(sidecar, "rb") as f:
+            cached = json.load(f)
+        if cached.get("sha256") == digest:
+            return cached["data"]
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+
+    # yaml은 YAML 파일을 실제로 파싱할 때만 import
+    import yaml
+
+    try:
+        # libyaml C 바인딩 사용 가능 시 우선 사용 (순수 Python 로더 대비 수 배 빠름)
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+
+    data = yaml.load(raw.decode("utf-8"), Loader=Loader) or {}
+
+    # JSON으로 그대로 표현되는 경우에만 기록 (숫자 키, 날짜 등은 의미가 바뀌므로 YAML 재파싱 유지)
+    # 사이드카 기록 실패(읽기 전용 디렉터리 등)는 무시
+    tmp = f"{sidecar}.tmp"
+    try:
+        encoded = json.dumps({"sha256": digest, "data": data})
+        if json.loads(encoded)["data"] == data:
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(encoded)
+            os.replace(tmp, sidecar)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+    return data
+
+
+# 섹션 이름 -> 설정 클래스
+_SECTION_TYPES = {
+    "aws": AwsConfig,
+    "sqs": SqsConfig,
+    "s3": S3Config,
+    "docker": DockerConfig,
+    "warm_pool": WarmPoolConfig,
+    "polling": PollingConfig,
+    "redis": RedisConfig,
+    "output": OutputConfig,
+    "gcp": GcpConfig,
+    "features": FeaturesConfig,
+}
+
+
+def _to_bool(value: str) -> bool:
+    return value.lower() == "true"
+
+
+# 환경 변수 매핑 테이블: (섹션, 필드, 환경 변수, 변환 함수)
+_ENV_SPEC = (
+    # AWS
+    ("aws", "region", "AWS_REGION", str),
+    # SQS
+    ("sqs", "queue_url", "SQS_QUEUE_URL", str),
+    ("sqs", "wait_time_seconds", "SQS_WAIT_TIME_SECONDS", int),
+    ("sqs", "max_number_of_messages", "SQS_MAX_MESSAGES", int),
+    ("sqs", "visibility_timeout_seconds", "SQS_VISIBILITY_TIMEOUT", int),
+    ("sqs", "receiver_parallelism", "SQS_RECEIVER_PARALLELISM", int),
+    # S3
+    ("s3", "code_bucket", "S3_CODE_BUCKET", str),
+    ("s3", "user_data_bucket", "S3_USER_DATA_BUCKET", str),
+    ("s3", "inmemory_threshold", "S3_INMEMORY_THRESHOLD", int),
+    # Docker
+    ("docker", "python_image", "DOCKER_PYTHON_IMAGE", str),
+    ("docker", "cpp_image", "DOCKER_CPP_IMAGE", str),
+    ("docker", "nodejs_image", "DOCKER_NODEJS_IMAGE", str),
+    ("docker", "go_image", "DOCKER_GO_IMAGE", str),
+    ("docker", "work_dir_root", "DOCKER_WORK_DIR_ROOT", str),
+    ("docker", "default_timeout_ms", "DOCKER_TIMEOUT_MS", int),
+    # Warm Pool
+    ("warm_pool", "enabled", "WARM_POOL_ENABLED", _to_bool),
+    ("warm_pool", "python_size", "WARM_POOL_PYTHON_SIZE", int),
+    ("warm_pool", "cpp_size", "WARM_POOL_CPP_SIZE", int),
+    # Polling
+    ("polling", "worker_count", "POLLING_WORKER_COUNT", int),
+    ("polling", "docker_concurrency", "POLLING_DOCKER_CONCURRENCY", int),
+    ("polling", "prefetch_count", "POLLING_PREFETCH_COUNT", int),
+    # Redis
+    ("redis", "host", "REDIS_HOST", str),
+    ("redis", "port", "REDIS_PORT", int),
+    ("redis", "password", "REDIS_PASSWORD", str),
+    ("redis", "result_prefix", "REDIS_RESULT_PREFIX", str),
+    # Output
+    ("output", "enabled", "OUTPUT_ENABLED", _to_bool),
+    ("output", "base_dir", "OUTPUT_BASE_DIR", str),
+    ("output", "s3_prefix", "OUTPUT_S3_PREFIX", str),
+    ("output", "upload_concurrency", "OUTPUT_UPLOAD_CONCURRENCY", int),
+    # GCP
+    ("gcp", "enabled", "GCP_ENABLED", _to_bool),
+    ("gcp", "bucket_name", "GCP_BUCKET_NAME", str),
+    ("gcp", "credentials_path", "GOOGLE_APPLICATION_CREDENTIALS", str),
+    # Features
+    ("features", "measure_memory", "FEATURE_MEASURE_MEMORY", _to_bool),
+    ("features", "debug_workdir_ls", "FEATURE_DEBUG_WORKDIR_LS", _to_bool),
+)
+
+# from_env가 참조하는 모든 환경 변수 이름 (캐시 키 구성용)
+_ENV_KEYS = tuple(env_var for _, _, env_var, _ in _ENV_SPEC) + ("TASK_BASE_DIR",)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class AgentConfig:
     """에이전트 통합 설정"""
     aws: AwsConfig = field(default_factory=AwsConfig)
@@ -91,118 +238,91 @@ class AgentConfig:
     redis: RedisConfig = field(default_factory=RedisConfig)
     output: OutputConfig = field(default_factory=OutputConfig)
     gcp: GcpConfig = field(default_factory=GcpConfig)
+    features: FeaturesConfig = field(default_factory=FeaturesConfig)
     task_base_dir: str = "/tmp/task"
 
     @classmethod
     def from_dict(cls, data: dict) -> "AgentConfig":
         """딕셔너리에서 설정 로드"""
-        config = cls()
-
-        if "aws" in data:
-            config.aws = AwsConfig(**data["aws"])
-        if "sqs" in data:
-            config.sqs = SqsConfig(**data["sqs"])
-        if "s3" in data:
-            config.s3 = S3Config(**data["s3"])
-        if "docker" in data:
-            config.docker = DockerConfig(**data["docker"])
-        if "warm_pool" in data:
-            config.warm_pool = WarmPoolConfig(**data["warm_pool"])
-        if "polling" in data:
-            config.polling = PollingConfig(**data["polling"])
-        if "redis" in data:
-            config.redis = RedisConfig(**data["redis"])
-        if "output" in data:
-            config.output = OutputConfig(**data["output"])
-        if "gcp" in data:
-            config.gcp = GcpConfig(**data["gcp"])
+        kwargs = {
+            section: section_type(**data[section])
+            for section, section_type in _SECTION_TYPES.items()
+            if section in data
+        }
+
         if "task_base_dir" in data:
-            config.task_base_dir = data["task_base_dir"]
+            kwargs["task_base_dir"] = data["task_base_dir"]
 
-        return config
+        return cls(**kwargs)
 
     @classmethod
     def from_yaml(cls, path: str) -> "AgentConfig":
-        """YAML 파일에서 설정 로드"""
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-        return cls.from_dict(data or {})
+        """YAML 파일에서 설정 로드 (파일이 변경되지 않았으면 캐시 사용)"""
+        st = os.stat(path)
+        key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+        data = _YAML_CACHE.get(key)
+        if data is None:
+            data = _load_yaml_with_json_sidecar(path)
+
+            # 단순 FIFO 방식으로 캐시 크기 제한
+            if len(_YAML_CACHE) >= _YAML_CACHE_MAX_ENTRIES:
+                _YAML_CACHE.pop(next(iter(_YAML_CACHE)))
+            _YAML_CACHE[key] = data
+
+        return cls.from_dict(data)
 
     @classmethod
     def from_env(cls) -> "AgentConfig":
-        """환경 변수에서 설정 로드"""
-        config = cls()
-
-        # AWS
-        config.aws.region = os.getenv("AWS_REGION", config.aws.region)
-
-        # SQS
-        config.sqs.queue_url = os.getenv("SQS_QUEUE_URL", config.sqs.queue_url)
-        config.sqs.wait_time_seconds = int(os.getenv("SQS_WAIT_TIME_SECONDS", config.sqs.wait_time_seconds))
-        config.sqs.max_number_of_messages = int(os.getenv("SQS_MAX_MESSAGES", config.sqs.max_number_of_messages))
-
-        # S3
-        config.s3.code_bucket = os.getenv("S3_CODE_BUCKET", config.s3.code_bucket)
-        config.s3.user_data_bucket = os.getenv("S3_USER_DATA_BUCKET", config.s3.user_data_bucket)
-
-        # Docker
-        config.docker.python_image = os.getenv("DOCKER_PYTHON_IMAGE", config.docker.python_image)
-        config.docker.cpp_image = os.getenv("DOCKER_CPP_IMAGE", config.docker.cpp_image)
-        config.docker.nodejs_image = os.getenv("DOCKER_NODEJS_IMAGE", config.docker.nodejs_image)
-        config.docker.go_image = os.getenv("DOCKER_GO_IMAGE", config.docker.go_image)
-        config.docker.work_dir_root = os.getenv("DOCKER_WORK_DIR_ROOT", config.docker.work_dir_root)
-        config.docker.default_timeout_ms = int(os.getenv("DOCKER_TIMEOUT_MS", config.docker.default_timeout_ms))
-
-        # Warm Pool
-        config.warm_pool.enabled = os.getenv("WARM_POOL_ENABLED", "true").lower() == "true"
-        config.warm_pool.python_size = int(os.getenv("WARM_POOL_PYTHON_SIZE", config.warm_pool.python_size))
-        config.warm_pool.cpp_size = int(os.getenv("WARM_POOL_CPP_SIZE", config.warm_pool.cpp_size))
-
-        # Redis
-        config.redis.host = os.getenv("REDIS_HOST", config.redis.host)
-        config.redis.port = int(os.getenv("REDIS_PORT", config.redis.port))
-        config.redis.password = os.getenv("REDIS_PASSWORD", config.redis.password)
-        config.redis.result_prefix = os.getenv("REDIS_RESULT_PREFIX", config.redis.result_prefix)
-
-        # Output
-        config.output.enabled = os.getenv("OUTPUT_ENABLED", "true").lower() == "true"
-        config.output.base_dir = os.getenv("OUTPUT_BASE_DIR", config.output.base_dir)
-        config.output.s3_prefix = os.getenv("OUTPUT_S3_PREFIX", config.output.s3_prefix)
-
-        # GCP
-        config.gcp.enabled = os.getenv("GCP_ENABLED", "false").lower() == "true"
-        config.gcp.bucket_name = os.getenv("GCP_BUCKET_NAME", config.gcp.bucket_name)
-        config.gcp.credentials_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS", config.gcp.credentials_path)
+        """환경 변수에서 설정 로드 (관련 환경 변수가 같으면 캐시된 설정 반환)"""
+        env = os.environ
+        return cls._from_env_values(tuple(env.get(key) for key in _ENV_KEYS))
+
+    @classmethod
+    @functools.lru_cache(maxsize=4)
+    def _from_env_values(cls, values: Tuple[Optional[str], ...]) -> "AgentConfig":
+        """_ENV_KEYS 순서의 환경 변수 값으로 설정 생성"""
+        overrides: Dict[str, dict] = {}
+        for (section, name, _, cast), value in zip(_ENV_SPEC, values):
+            if value is not None:
+                overrides.setdefault(section, {})[name] = cast(value)
+
+        kwargs = {
+            section: _SECTION_TYPES[section](**section_values)
+            for section, section_values in overrides.items()
+        }
 
         # Task
-        config.task_base_dir = os.getenv("TASK_BASE_DIR", config.task_base_dir)
+        task_base_dir = values[-1]
+        if task_base_dir is not None:
+            kwargs["task_base_dir"] = task_base_dir
 
-        return config
+        return cls(**kwargs)
 
     @classmethod
     def load(cls, config_path: Optional[str] = None) -> "AgentConfig":
         """설정 로드 (YAML 파일 우선, 환경 변수 fallback)"""
+        env = os.environ
+        ng_path = env.get("NANOGRID_CONFIG")
+
         # 1. 명시적 경로
         if config_path and Path(config_path).exists():
             config = cls.from_yaml(config_path)
         # 2. 환경 변수로 지정된 경로
-        elif os.getenv("NANOGRID_CONFIG") and Path(os.getenv("NANOGRID_CONFIG")).exists():
-            config = cls.from_yaml(os.getenv("NANOGRID_CONFIG"))
+        elif ng_path and Path(ng_path).exists():
+            config = cls.from_yaml(ng_path)
         # 3. 기본 경로
         elif Path("config.yaml").exists():
             config = cls.from_yaml("config.yaml")
-        # 4. 환경 변수에서 로드
+        # 4. 환경 변수에서 로드 (이미 환경 변수가 모두 반영되어 있으므로 오버라이드 불필요)
         else:
-            config = cls.from_env()
+            return cls.from_env()
 
         # 환경 변수로 오버라이드 (우선순위 높음)
-        env_config = cls.from_env()
-
-        # SQS URL이 환경 변수에 있으면 오버라이드
-        if os.getenv("SQS_QUEUE_URL"):
-            config.sqs.queue_url = env_config.sqs.queue_url
-        if os.getenv("REDIS_HOST"):
-            config.redis.host = env_config.redis.host
+        if sqs_queue_url := env.get("SQS_QUEUE_URL"):
+            config = replace(config, sqs=replace(config.sqs, queue_url=sqs_queue_url))
+        if redis_host := env.get("REDIS_HOST"):
+            config = replace(config, redis=replace(config.redis, host=redis_host))
 
         return config
 
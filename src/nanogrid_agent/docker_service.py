@@ -4,23 +4,119 @@ Docker 서비스 및 Warm Pool 관리
 Docker 컨테이너 실행 및 재사용 관리
 """
 
-import json
+import io
+import logging
+import socket
+import struct
+import tarfile
+import threading
 import time
+import uuid
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import Enum
 from pathlib import Path
-from threading import Lock
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 import docker
 import structlog
 from docker.models.containers import Container
 
+from . import jsonutil
 from .config import AgentConfig
 from .models import TaskMessage, ExecutionResult
 
 
 logger = structlog.get_logger()
+# 로그 레벨 확인용 stdlib 로거 (레벨은 main.configure_logging에서 설정)
+_level_logger = logging.getLogger(__name__)
+
+# 컨테이너 피크 메모리 cgroup 파일 경로 후보 (cgroup v2 systemd/cgroupfs, cgroup v1 순)
+# Warm Pool 컨테이너는 재사용되므로 exec 전에 리셋한 경우에만 사용
+# (v1은 0 기록 시 리셋, v2는 쓰기한 fd로 읽을 때만 리셋된 값이 보임 - 커널 6.12+)
+_CGROUP_MEMORY_PEAK_PATHS = (
+    "/sys/fs/cgroup/system.slice/docker-{id}.scope/memory.peak",
+    "/sys/fs/cgroup/docker/{id}/memory.peak",
+    "/sys/fs/cgroup/memory/system.slice/docker-{id}.scope/memory.max_usage_in_bytes",
+    "/sys/fs/cgroup/memory/docker/{id}/memory.max_usage_in_bytes",
+)
+
+# 피크 리셋이 불가능할 때 사용하는 현재 메모리 사용량 파일 경로 후보 (순서 동일)
+_CGROUP_MEMORY_USAGE_PATHS = (
+    "/sys/fs/cgroup/system.slice/docker-{id}.scope/memory.current",
+    "/sys/fs/cgroup/docker/{id}/memory.current",
+    "/sys/fs/cgroup/memory/system.slice/docker-{id}.scope/memory.usage_in_bytes",
+    "/sys/fs/cgroup/memory/docker/{id}/memory.usage_in_bytes",
+)
+
+# exec 소켓 recv 크기 / 송수신 버퍼 크기
+_STREAM_RECV_SIZE = 65536
+_STREAM_SOCKET_BUFFER_SIZE = 1024 * 1024
+
+# multiplexed stream 프레임 헤더: stream_type(1) + padding(3) + size(4, big-endian)
+_FRAME_HEADER = struct.Struct(">BxxxI")
+
+
+def _tune_socket_buffers(sock) -> None:
+    """대용량 stdin/stdout 전송 시 syscall 수를 줄이도록 소켓 버퍼 확대 (실패 시 무시)"""
+    for option in (socket.SO_SNDBUF, socket.SO_RCVBUF):
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, option, _STREAM_SOCKET_BUFFER_SIZE)
+        except (OSError, AttributeError):
+            pass
+
+
+def _read_multiplexed_stream(sock) -> Tuple[bytearray, bytearray]:
+    """
+    Docker API의 multiplexed stream을 읽어 (stdout, stderr)로 분리
+
+    각 프레임은 8바이트 헤더 [stream_type(1), 0, 0, 0, size(4)] + payload.
+    헤더 읽기 / payload 읽기 두 상태를 오가며 recv 청크를 한 번에 소비하므로
+    프레임이 recv 경계에 걸쳐도 재슬라이싱 없이 O(N)으로 처리됨
+    """
+    outputs = {1: bytearray(), 2: bytearray()}  # 1: stdout, 2: stderr
+    header_size = _FRAME_HEADER.size
+    unpack_header = _FRAME_HEADER.unpack_from
+    header = bytearray()  # recv 경계에 걸친 헤더 조각
+    target: Optional[bytearray] = None
+    remaining = 0  # 현재 프레임에서 남은 payload 바이트 수
+
+    while True:
+        try:
+            data = sock.recv(_STREAM_RECV_SIZE)
+        except Exception:
+            break
+        if not data:
+            break
+
+        view = memoryview(data)
+        pos = 0
+        end = len(view)
+        while pos < end:
+            if remaining == 0:
+                # 헤더 읽기 상태
+                if not header and end - pos >= header_size:
+                    # 헤더 전체가 청크 안에 있으면 복사 없이 바로 해석
+                    stream_type, remaining = unpack_header(view, pos)
+                    pos += header_size
+                else:
+                    take = min(header_size - len(header), end - pos)
+                    header += view[pos:pos + take]
+                    pos += take
+                    if len(header) < header_size:
+                        break
+                    stream_type, remaining = unpack_header(header)
+                    header.clear()
+                target = outputs.get(stream_type)
+            else:
+                # payload 읽기 상태
+                take = min(remaining, end - pos)
+                if target is not None:
+                    target += view[pos:pos + take]
+                pos += take
+                remaining -= take
+
+    return outputs[1], outputs[2]
 
 
 class RuntimeType(Enum):
@@ -31,12 +127,43 @@ class RuntimeType(Enum):
     GO = "go"
 
 
+# 런타임 문자열(소문자) -> RuntimeType
+_RUNTIME_ALIASES: Dict[str, RuntimeType] = {
+    "python": RuntimeType.PYTHON,
+    "cpp": RuntimeType.CPP,
+    "c++": RuntimeType.CPP,
+    "nodejs": RuntimeType.NODEJS,
+    "node": RuntimeType.NODEJS,
+    "javascript": RuntimeType.NODEJS,
+    "js": RuntimeType.NODEJS,
+    "go": RuntimeType.GO,
+    "golang": RuntimeType.GO,
+}
+
+# RuntimeType -> 실행 커맨드
+_RUNTIME_COMMANDS: Dict[RuntimeType, Tuple[str, ...]] = {
+    RuntimeType.PYTHON: ("python", "main.py"),
+    RuntimeType.CPP: ("/bin/bash", "run.sh"),
+    RuntimeType.NODEJS: ("node", "index.js"),
+    RuntimeType.GO: ("/bin/bash", "run.sh"),
+}
+
+
 class WarmPoolManager:
     """
     Docker Warm Pool Manager
 
     컨테이너를 미리 생성하고 Pause 상태로 유지하다가
     요청 시 Unpause하여 재사용
+
+    가장 최근에 반환된 컨테이너를 먼저 재사용 (LIFO)
+
+    목표 크기는 유휴 + 점유 중 + 생성 중 컨테이너 수 기준이므로,
+    점유된 컨테이너가 반환될 예정이면 보충하지 않음. 컨테이너가 정리되어
+    전체 수가 목표보다 작아지면 백그라운드 refill 스레드가 보충하고,
+    요청 경로에서는 Pool이 완전히 비었을 때만 컨테이너를 직접 생성.
+    동시 요청이 목표보다 많아 추가 생성된 컨테이너는 반환 시 유휴 컨테이너가
+    목표 크기에 도달해 있으면 삭제. Pool / 카운터 변경은 _pool_lock으로 보호
     """
 
     def __init__(self, config: AgentConfig, docker_client: docker.DockerClient):
@@ -48,12 +175,30 @@ class WarmPoolManager:
             RuntimeType.NODEJS: deque(),
             RuntimeType.GO: deque(),
         }
-        self.locks: Dict[RuntimeType, Lock] = {
-            RuntimeType.PYTHON: Lock(),
-            RuntimeType.CPP: Lock(),
-            RuntimeType.NODEJS: Lock(),
-            RuntimeType.GO: Lock(),
+        # Pool과 아래 카운터를 함께 확인/변경하기 위한 Lock
+        self._pool_lock = threading.Lock()
+        # 런타임별 점유 중(acquire 후 release 전) / refill 스레드가 생성 중인 컨테이너 수
+        self._checked_out: Dict[RuntimeType, int] = {runtime_type: 0 for runtime_type in self.pools}
+        self._pending: Dict[RuntimeType, int] = {runtime_type: 0 for runtime_type in self.pools}
+        # container_id -> Container 캐시 (containers.get inspect 왕복 제거)
+        self._containers: Dict[str, Container] = {}
+        # 볼륨 마운트가 정상 동작하는 것으로 확인된 컨테이너 ID
+        # (작업 디렉터리 존재 확인 exec를 생략하기 위해 사용)
+        self.mounted_containers: Set[str] = set()
+
+        # 런타임별 목표 Pool 크기
+        self._target_sizes: Dict[RuntimeType, int] = {
+            RuntimeType.PYTHON: config.warm_pool.python_size,
+            RuntimeType.CPP: config.warm_pool.cpp_size,
+            RuntimeType.NODEJS: config.warm_pool.nodejs_size,
+            RuntimeType.GO: config.warm_pool.go_size,
         }
+        self._refill_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._refill_thread = threading.Thread(
+            target=self._refill_loop, name="warmpool-refill", daemon=True
+        )
+        self._refill_thread.start()
 
     def initialize(self) -> None:
         """Warm Pool 초기화 - 컨테이너 미리 생성"""
@@ -65,37 +210,52 @@ class WarmPoolManager:
         logger.info("Initializing Warm Pool Manager")
         logger.info("=" * 40)
 
-        # Python Pool
-        python_size = self.config.warm_pool.python_size
-        logger.info(f"Creating {python_size} Python containers for Warm Pool")
-        for i in range(python_size):
-            container_id = self._create_and_pause_container(RuntimeType.PYTHON)
-            self.pools[RuntimeType.PYTHON].append(container_id)
-            logger.info(f"  [{i + 1}] Python container created: {container_id[:12]}")
-
-        # C++ Pool
-        cpp_size = self.config.warm_pool.cpp_size
-        logger.info(f"Creating {cpp_size} C++ containers for Warm Pool")
-        for i in range(cpp_size):
-            container_id = self._create_and_pause_container(RuntimeType.CPP)
-            self.pools[RuntimeType.CPP].append(container_id)
-            logger.info(f"  [{i + 1}] C++ container created: {container_id[:12]}")
-
-        # Node.js Pool
-        nodejs_size = self.config.warm_pool.nodejs_size
-        logger.info(f"Creating {nodejs_size} Node.js containers for Warm Pool")
-        for i in range(nodejs_size):
-            container_id = self._create_and_pause_container(RuntimeType.NODEJS)
-            self.pools[RuntimeType.NODEJS].append(container_id)
-            logger.info(f"  [{i + 1}] Node.js container created: {container_id[:12]}")
-
-        # Go Pool
-        go_size = self.config.warm_pool.go_size
-        logger.info(f"Creating {go_size} Go containers for Warm Pool")
-        for i in range(go_size):
-            container_id = self._create_and_pause_container(RuntimeType.GO)
-            self.pools[RuntimeType.GO].append(container_id)
-            logger.info(f"  [{i + 1}] Go container created: {container_id[:12]}")
+        jobs = [
+            runtime_type
+            for runtime_type, size in self._target_sizes.items()
+            for _ in range(size)
+        ]
+
+        if jobs:
+            # dockerd 왕복 시간이 대부분이므로 컨테이너를 병렬로 생성
+            logger.info(f"Creating {len(jobs)} containers for Warm Pool")
+            created: List[Tuple[RuntimeType, str]] = []
+            first_error: Optional[BaseException] = None
+            with ThreadPoolExecutor(
+                max_workers=min(32, len(jobs)), thread_name_prefix="warmpool-init"
+            ) as executor:
+                futures = {
+                    executor.submit(self._create_and_pause_container, runtime_type): runtime_type
+                    for runtime_type in jobs
+                }
+                # 일부가 실패해도 나머지 결과를 모두 수집 (생성된 컨테이너 누수 방지)
+                for future in as_completed(futures):
+                    runtime_type = futures[future]
+                    try:
+                        container_id = future.result()
+                    except Exception as e:
+                        logger.error(
+                            "Failed to create warm pool container",
+                            runtime=runtime_type.value,
+                            error=str(e),
+                        )
+                        if first_error is None:
+                            first_error = e
+                        continue
+                    created.append((runtime_type, container_id))
+                    logger.info(
+                        f"  {runtime_type.value} container created: {container_id[:12]}"
+                    )
+
+            if first_error is not None:
+                # 초기화 실패 시 이미 생성된 컨테이너는 Pool에 넣지 않고 삭제한 뒤 예외 전달
+                for _, container_id in created:
+                    self._cleanup_container(container_id)
+                raise first_error
+
+            with self._pool_lock:
+                for runtime_type, container_id in created:
+                    self.pools[runtime_type].append(container_id)
 
         logger.info("Warm Pool initialization completed")
         logger.info(f"  - Python Pool: {len(self.pools[RuntimeType.PYTHON])} containers")
@@ -104,6 +264,59 @@ class WarmPoolManager:
         logger.info(f"  - Go Pool: {len(self.pools[RuntimeType.GO])} containers")
         logger.info("=" * 40)
 
+    def _managed_count(self, runtime_type: RuntimeType) -> int:
+        """유휴 + 점유 중 + 생성 중 컨테이너 수 (_pool_lock 보유 상태에서 호출)"""
+        return (
+            len(self.pools[runtime_type])
+            + self._checked_out[runtime_type]
+            + self._pending[runtime_type]
+        )
+
+    def _request_refill(self, runtime_type: RuntimeType) -> None:
+        """전체 컨테이너 수가 목표치보다 작으면 refill 스레드 깨우기"""
+        if not self.config.warm_pool.enabled:
+            return
+        with self._pool_lock:
+            needed = self._managed_count(runtime_type) < self._target_sizes[runtime_type]
+        if needed:
+            self._refill_event.set()
+
+    def _refill_loop(self) -> None:
+        """목표 크기에 못 미치는 Pool에 컨테이너 보충 (요청 경로 밖에서 생성)"""
+        while True:
+            self._refill_event.wait()
+            self._refill_event.clear()
+            if self._stop_event.is_set():
+                return
+
+            for runtime_type, target_size in self._target_sizes.items():
+                pool = self.pools[runtime_type]
+                while not self._stop_event.is_set():
+                    with self._pool_lock:
+                        if self._managed_count(runtime_type) >= target_size:
+                            break
+                        self._pending[runtime_type] += 1
+                    try:
+                        container_id = self._create_and_pause_container(runtime_type)
+                    except Exception as e:
+                        logger.error(
+                            "Failed to refill warm pool",
+                            runtime=runtime_type.value,
+                            error=str(e),
+                        )
+                        with self._pool_lock:
+                            self._pending[runtime_type] -= 1
+                        break
+                    with self._pool_lock:
+                        self._pending[runtime_type] -= 1
+                        pool.append(container_id)
+                    logger.info(
+                        "Refilled warm pool",
+                        container_id=container_id[:12],
+                        runtime=runtime_type.value,
+                        pool_size=len(pool),
+                    )
+
     def _get_image_name(self, runtime_type: RuntimeType) -> str:
         """런타임 타입에 따른 이미지 이름 반환"""
         if runtime_type == RuntimeType.PYTHON:
@@ -120,7 +333,8 @@ class WarmPoolManager:
     def _create_and_pause_container(self, runtime_type: RuntimeType) -> str:
         """컨테이너 생성 및 Pause"""
         image_name = self._get_image_name(runtime_type)
-        container_name = f"nanogrid-warmpool-{runtime_type.value}-{int(time.time() * 1000)}"
+        # 병렬 생성 시에도 겹치지 않는 이름
+        container_name = f"nanogrid-warmpool-{runtime_type.value}-{uuid.uuid4().hex[:12]}"
 
         logger.debug(
             "Creating warm pool container",
@@ -144,62 +358,98 @@ class WarmPoolManager:
         container.pause()
         logger.debug("Paused container", container_id=container.id[:12])
 
+        self._containers[container.id] = container
         return container.id
 
+    def get_container(self, container_id: str) -> Container:
+        """캐시된 Container 객체 반환 (없으면 조회 후 캐시)"""
+        container = self._containers.get(container_id)
+        if container is None:
+            container = self.client.containers.get(container_id)
+            self._containers[container_id] = container
+        return container
+
     def acquire_container(self, runtime_type: RuntimeType) -> str:
         """Pool에서 컨테이너 획득 (Unpause 포함)"""
         logger.debug("Acquiring container", runtime=runtime_type.value)
 
-        with self.locks[runtime_type]:
-            pool = self.pools[runtime_type]
+        # Pool에서 컨테이너 가져오기 (LIFO), 반환 전까지 점유 중으로 집계
+        with self._pool_lock:
+            try:
+                container_id: Optional[str] = self.pools[runtime_type].pop()
+            except IndexError:
+                container_id = None
+            self._checked_out[runtime_type] += 1
 
-            # Pool에서 컨테이너 가져오기
-            container_id = pool.popleft() if pool else None
-
-            # Pool이 비어있으면 새로 생성
+        try:
             if container_id is None:
+                # Pool이 비어있으면 새로 생성
                 logger.warning("Pool is empty, creating new container", runtime=runtime_type.value)
                 container_id = self._create_and_pause_container(runtime_type)
 
-        # Unpause
-        try:
-            container = self.client.containers.get(container_id)
-            container.unpause()
-            logger.info(
-                "Acquired and unpaused container",
-                container_id=container_id[:12],
-                runtime=runtime_type.value,
-            )
-            return container_id
-        except Exception as e:
-            logger.error("Failed to unpause container, creating new one", error=str(e))
-            self._cleanup_container(container_id)
-            container_id = self._create_and_pause_container(runtime_type)
-            container = self.client.containers.get(container_id)
-            container.unpause()
-            return container_id
+            # Unpause
+            try:
+                container = self.get_container(container_id)
+                container.unpause()
+                logger.info(
+                    "Acquired and unpaused container",
+                    container_id=container_id[:12],
+                    runtime=runtime_type.value,
+                )
+                return container_id
+            except Exception as e:
+                logger.error("Failed to unpause container, creating new one", error=str(e))
+                self._cleanup_container(container_id)
+                container_id = self._create_and_pause_container(runtime_type)
+                self.get_container(container_id).unpause()
+                return container_id
+        except Exception:
+            # 획득 실패: 반환되지 않으므로 점유 집계에서 제외하고 필요 시 보충
+            with self._pool_lock:
+                self._checked_out[runtime_type] -= 1
+            self._request_refill(runtime_type)
+            raise
 
     def release_container(self, runtime_type: RuntimeType, container_id: str) -> None:
         """컨테이너를 Pool에 반환 (Pause 포함)"""
         logger.debug("Releasing container", container_id=container_id[:12], runtime=runtime_type.value)
 
+        pool = self.pools[runtime_type]
+        target_size = self._target_sizes[runtime_type]
         try:
-            container = self.client.containers.get(container_id)
-
-            # 상태 확인
-            if container.status != "running":
-                logger.warning("Container is not running, removing", container_id=container_id[:12])
+            # 동시 요청으로 추가 생성된 컨테이너: 유휴 컨테이너가 이미 목표 크기면 삭제
+            with self._pool_lock:
+                surplus = len(pool) + self._pending[runtime_type] >= target_size
+                if surplus:
+                    self._checked_out[runtime_type] -= 1
+            if surplus:
+                logger.debug(
+                    "Pool is full, removing released container",
+                    container_id=container_id[:12],
+                    runtime=runtime_type.value,
+                )
                 self._cleanup_container(container_id)
                 return
 
-            # Pause
-            container.pause()
+            # Pause (실행 중이 아닌 컨테이너는 pause가 실패하여 아래에서 정리됨)
+            try:
+                self.get_container(container_id).pause()
+            except Exception:
+                with self._pool_lock:
+                    self._checked_out[runtime_type] -= 1
+                raise
             logger.debug("Paused container", container_id=container_id[:12])
 
-            # Pool에 반환
-            with self.locks[runtime_type]:
-                self.pools[runtime_type].append(container_id)
-                pool_size = len(self.pools[runtime_type])
+            # Pool에 반환 (점유 집계에서 유휴로 이동, pause 중 다른 반환으로 가득 찼으면 삭제)
+            with self._pool_lock:
+                self._checked_out[runtime_type] -= 1
+                returned = len(pool) + self._pending[runtime_type] < target_size
+                if returned:
+                    pool.append(container_id)
+                pool_size = len(pool)
+            if not returned:
+                self._cleanup_container(container_id)
+                return
 
             logger.info(
                 "Released container back to pool",
@@ -211,19 +461,16 @@ class WarmPoolManager:
         except Exception as e:
             logger.error("Failed to release container", container_id=container_id[:12], error=str(e))
             self._cleanup_container(container_id)
+            self._request_refill(runtime_type)
 
     def _cleanup_container(self, container_id: str) -> None:
-        """컨테이너 정리 (Stop & Remove)"""
-        try:
-            container = self.client.containers.get(container_id)
-            container.stop(timeout=5)
-            logger.debug("Stopped container", container_id=container_id[:12])
-        except Exception:
-            pass
+        """컨테이너 정리 (강제 Remove)"""
+        self._containers.pop(container_id, None)
+        self.mounted_containers.discard(container_id)
 
         try:
-            container = self.client.containers.get(container_id)
-            container.remove(force=True)
+            # force=True: 실행/일시정지 상태여도 한 번의 API 호출로 중지 및 삭제
+            self.client.api.remove_container(container_id, force=True, v=True)
             logger.debug("Removed container", container_id=container_id[:12])
         except Exception as e:
             logger.warning("Failed to remove container", container_id=container_id[:12], error=str(e))
@@ -232,10 +479,18 @@ class WarmPoolManager:
         """모든 Pool 컨테이너 정리"""
         logger.info("Cleaning up Warm Pool containers...")
 
+        # 정리 중 refill 스레드가 컨테이너를 추가하지 않도록 먼저 중지
+        self._stop_event.set()
+        self._refill_event.set()
+        self._refill_thread.join()
+
         for runtime_type, pool in self.pools.items():
             logger.info(f"Cleaning up {runtime_type.value} pool ({len(pool)} containers)")
-            while pool:
-                container_id = pool.popleft()
+            while True:
+                try:
+                    container_id = pool.pop()
+                except IndexError:
+                    break
                 self._cleanup_container(container_id)
 
         logger.info("Warm Pool cleanup completed")
@@ -278,55 +533,64 @@ class DockerService:
         # RuntimeType 결정
         runtime_type = self._resolve_runtime_type(runtime)
         container_id: Optional[str] = None
-        start_time = time.time()
+        peak_file = None
+        start_ns = time.monotonic_ns()
 
         try:
-            # 1. Warm Pool에서 컨테이너 획득
-            container_id = self.warm_pool.acquire_container(runtime_type)
-            logger.info(
-                "Acquired container from Warm Pool",
-                container_id=container_id[:12],
-                request_id=request_id,
-            )
-
-            # 2. Output 디렉터리 생성
+            # 컨테이너를 점유하는 시간을 줄이기 위해 호스트 측 준비는 획득 전에 수행
+            # 1. Output 디렉터리 생성
             output_dir = self._create_output_directory(request_id)
             logger.debug("Created output directory", output_dir=str(output_dir))
 
-            # 3. 컨테이너 내부 작업 디렉터리 경로
+            # 2. 컨테이너 내부 작업 디렉터리 경로
             container_work_dir = f"{self.config.docker.work_dir_root}/{request_id}"
             logger.debug("Container work dir", path=container_work_dir)
 
-            # 3.5. 컨테이너 내부에서 작업 디렉터리 존재 확인 및 동기화
-            self._ensure_workdir_in_container(container_id, container_work_dir, work_dir)
-
-            # 4. 런타임별 실행 커맨드
-            cmd = self._build_command(runtime)
-            logger.info("Executing command", container_id=container_id[:12], cmd=cmd)
+            # 3. 런타임별 실행 커맨드
+            cmd = self._build_command(runtime_type)
 
-            # 5. input 데이터를 JSON 문자열로 변환 (stdin으로 전달)
+            # 4. input 데이터를 JSON bytes로 변환 (stdin으로 전달)
             stdin_data = None
             if task.input:
-                stdin_data = json.dumps(task.input, ensure_ascii=False)
+                stdin_data = jsonutil.dumps(task.input)
                 logger.info(
                     "Input data will be passed via stdin",
                     input_size=len(stdin_data),
                     request_id=request_id,
                 )
 
+            # 5. Warm Pool에서 컨테이너 획득
+            container_id = self.warm_pool.acquire_container(runtime_type)
+            short_id = container_id[:12]
+            logger.info(
+                "Acquired container from Warm Pool",
+                container_id=short_id,
+                request_id=request_id,
+            )
+
+            # 5.5. 컨테이너 내부에서 작업 디렉터리 존재 확인 및 동기화
+            self._ensure_workdir_in_container(container_id, container_work_dir, work_dir)
+
+            # 이전 작업의 피크가 섞이지 않도록 exec 직전에 피크 카운터 리셋
+            if self.config.features.measure_memory:
+                peak_file = self._reset_memory_peak(container_id)
+
+            logger.info("Executing command", container_id=short_id, cmd=cmd)
+
             # 6. docker exec로 명령 실행 (stdin 전달)
             exit_code, stdout, stderr = self._execute_in_container(
                 container_id, container_work_dir, cmd,
                 stdin_data=stdin_data  # stdin으로 input 전달
             )
 
-            duration_millis = int((time.time() - start_time) * 1000)
-
-            # 6. 메모리 측정
-            peak_memory_bytes = self._measure_memory(container_id)
+            duration_millis = (time.monotonic_ns() - start_ns) // 1_000_000
 
-            # 7. 최적화 팁 생성
-            optimization_tip = self._create_optimization_tip(task, peak_memory_bytes)
+            # 6. 메모리 측정 및 7. 최적화 팁 생성 (비활성화 시 생략)
+            peak_memory_bytes = None
+            optimization_tip = None
+            if self.config.features.measure_memory:
+                peak_memory_bytes = self._measure_memory(container_id, peak_file)
+                optimization_tip = self._create_optimization_tip(task, peak_memory_bytes)
 
             logger.info(
                 "Execution finished",
@@ -350,7 +614,7 @@ class DockerService:
             )
 
         except Exception as e:
-            duration_millis = int((time.time() - start_time) * 1000)
+            duration_millis = (time.monotonic_ns() - start_ns) // 1_000_000
             logger.error(
                 "Execution failed",
                 request_id=request_id,
@@ -368,27 +632,23 @@ class DockerService:
             )
 
         finally:
+            if peak_file is not None:
+                peak_file.close()
+
             # 컨테이너 반환
             if container_id:
                 try:
                     self.warm_pool.release_container(runtime_type, container_id)
-                    logger.debug("Released container", container_id=container_id[:12])
+                    logger.debug("Released container", container_id=short_id)
                 except Exception as e:
                     logger.error("Failed to release container", error=str(e))
 
     def _resolve_runtime_type(self, runtime: str) -> RuntimeType:
         """런타임 문자열을 RuntimeType으로 변환"""
-        runtime_lower = runtime.lower()
-        if runtime_lower == "python":
-            return RuntimeType.PYTHON
-        elif runtime_lower in ("cpp", "c++"):
-            return RuntimeType.CPP
-        elif runtime_lower in ("nodejs", "node", "javascript", "js"):
-            return RuntimeType.NODEJS
-        elif runtime_lower in ("go", "golang"):
-            return RuntimeType.GO
-        else:
-            raise ValueError(f"Unsupported runtime: {runtime}")
+        try:
+            return _RUNTIME_ALIASES[runtime.lower()]
+        except KeyError:
+            raise ValueError(f"Unsupported runtime: {runtime}") from None
 
     def _ensure_workdir_in_container(
         self, container_id: str, container_work_dir: str, host_work_dir: Path
@@ -398,8 +658,12 @@ class DockerService:
 
         볼륨 마운트된 디렉터리가 컨테이너에서 인식되지 않는 경우를 처리
         """
+        # 볼륨 마운트가 동작하는 것으로 확인된 컨테이너는 확인 생략
+        if container_id in self.warm_pool.mounted_containers:
+            return
+
         try:
-            container = self.client.containers.get(container_id)
+            container = self.warm_pool.get_container(container_id)
 
             # 디렉터리 존재 확인
             check_result = container.exec_run(
@@ -427,40 +691,34 @@ class DockerService:
                     )
                     raise RuntimeError(f"Failed to create work directory: {container_work_dir}")
 
-                # 호스트에서 파일 복사 (docker cp 사용)
-                import subprocess
-
-                # docker cp로 파일 복사
-                cp_cmd = [
-                    "docker", "cp",
-                    f"{host_work_dir}/.",  # 디렉터리 내용 전체
-                    f"{container_id}:{container_work_dir}/"
-                ]
-
-                result = subprocess.run(cp_cmd, capture_output=True, text=True)
-
-                if result.returncode != 0:
-                    logger.error(
-                        "Failed to copy files to container",
-                        stderr=result.stderr,
-                    )
-                    raise RuntimeError(f"Failed to copy files to container: {result.stderr}")
+                # 호스트에서 파일 복사 (Docker API put_archive - docker CLI fork 없이 단일 요청)
+                if not self.client.api.put_archive(
+                    container_id, container_work_dir, self._build_tar_archive(host_work_dir)
+                ):
+                    logger.error("Failed to copy files to container")
+                    raise RuntimeError("Failed to copy files to container")
 
                 logger.info(
                     "Successfully copied files to container",
                     container_work_dir=container_work_dir,
                 )
             else:
-                # 디렉터리 내용 확인
-                ls_result = container.exec_run(
-                    cmd=["ls", "-la", container_work_dir],
-                    workdir="/",
-                )
-                logger.debug(
-                    "Work directory exists in container",
-                    container_work_dir=container_work_dir,
-                    contents=ls_result.output.decode("utf-8", errors="replace")[:500],
-                )
+                self.warm_pool.mounted_containers.add(container_id)
+
+                # 디렉터리 내용 확인 (DEBUG 로그용 exec이므로 DEBUG가 아니면 생략)
+                if (
+                    self.config.features.debug_workdir_ls
+                    and _level_logger.isEnabledFor(logging.DEBUG)
+                ):
+                    ls_result = container.exec_run(
+                        cmd=["ls", "-la", container_work_dir],
+                        workdir="/",
+                    )
+                    logger.debug(
+                        "Work directory exists in container",
+                        container_work_dir=container_work_dir,
+                        contents=ls_result.output.decode("utf-8", errors="replace")[:500],
+                    )
 
         except Exception as e:
             logger.error(
@@ -470,23 +728,22 @@ class DockerService:
             )
             raise
 
-    def _build_command(self, runtime: str) -> List[str]:
+    @staticmethod
+    def _build_tar_archive(source_dir: Path) -> bytes:
+        """디렉터리 내용을 메모리 내 tar 아카이브로 생성"""
+        buf = io.BytesIO()
+        with tarfile.open(fileobj=buf, mode="w") as tar:
+            for entry in sorted(source_dir.iterdir()):
+                tar.add(str(entry), arcname=entry.name)
+        return buf.getvalue()
+
+    def _build_command(self, runtime_type: RuntimeType) -> List[str]:
         """런타임별 실행 커맨드 구성"""
-        runtime_lower = runtime.lower()
-        if runtime_lower == "python":
-            return ["python", "main.py"]
-        elif runtime_lower in ("cpp", "c++"):
-            return ["/bin/bash", "run.sh"]
-        elif runtime_lower in ("nodejs", "node", "javascript", "js"):
-            return ["node", "index.js"]
-        elif runtime_lower in ("go", "golang"):
-            return ["/bin/bash", "run.sh"]
-        else:
-            raise ValueError(f"Unsupported runtime: {runtime}")
+        return list(_RUNTIME_COMMANDS[runtime_type])
 
     def _execute_in_container(
         self, container_id: str, work_dir: str, cmd: List[str],
-        stdin_data: Optional[str] = None
+        stdin_data: Optional[bytes] = None
     ) -> Tuple[int, str, str]:
         """
         컨테이너 내부에서 명령 실행
@@ -495,13 +752,13 @@ class DockerService:
             container_id: Docker 컨테이너 ID
             work_dir: 컨테이너 내부 작업 디렉터리
             cmd: 실행할 명령어
-            stdin_data: stdin으로 전달할 데이터 (JSON 문자열)
+            stdin_data: stdin으로 전달할 데이터 (UTF-8 JSON bytes)
 
         Returns:
             (exit_code, stdout, stderr) 튜플
         """
         try:
-            container = self.client.containers.get(container_id)
+            container = self.warm_pool.get_container(container_id)
 
             if stdin_data:
                 # stdin 데이터가 있는 경우: API를 통해 stdin 전달
@@ -523,41 +780,20 @@ class DockerService:
                 )
 
                 # socket 모드로 exec 시작
-                socket = self.client.api.exec_start(
+                exec_socket = self.client.api.exec_start(
                     exec_id['Id'],
                     socket=True,
                     demux=True,
                 )
 
                 # stdin으로 데이터 전송
-                sock = socket._sock
-                sock.sendall(stdin_data.encode('utf-8'))
+                sock = exec_socket._sock
+                _tune_socket_buffers(sock)
+                sock.sendall(stdin_data)
                 sock.shutdown(1)  # SHUT_WR - 쓰기 종료
 
                 # 출력 읽기
-                stdout_chunks = []
-                stderr_chunks = []
-
-                while True:
-                    try:
-                        data = sock.recv(4096)
-                        if not data:
-                            break
-                        # Docker API의 multiplexed stream 형식 파싱
-                        # 처음 8바이트는 헤더: [stream_type(1), 0, 0, 0, size(4)]
-                        while len(data) >= 8:
-                            stream_type = data[0]
-                            size = int.from_bytes(data[4:8], 'big')
-                            if len(data) < 8 + size:
-                                break
-                            payload = data[8:8+size]
-                            if stream_type == 1:  # stdout
-                                stdout_chunks.append(payload)
-                            elif stream_type == 2:  # stderr
-                                stderr_chunks.append(payload)
-                            data = data[8+size:]
-                    except Exception:
-                        break
+                stdout_bytes, stderr_bytes = _read_multiplexed_stream(sock)
 
                 sock.close()
 
@@ -565,8 +801,8 @@ class DockerService:
                 exec_info = self.client.api.exec_inspect(exec_id['Id'])
                 exit_code = exec_info.get('ExitCode', -1)
 
-                stdout = b''.join(stdout_chunks).decode('utf-8', errors='replace')
-                stderr = b''.join(stderr_chunks).decode('utf-8', errors='replace')
+                stdout = stdout_bytes.decode('utf-8', errors='replace')
+                stderr = stderr_bytes.decode('utf-8', errors='replace')
 
                 logger.debug(
                     "Exec with stdin finished",
@@ -611,10 +847,55 @@ class DockerService:
         output_dir.mkdir(parents=True, exist_ok=True)
         return output_dir
 
-    def _measure_memory(self, container_id: str) -> Optional[int]:
-        """컨테이너 메모리 사용량 측정"""
+    def _reset_memory_peak(self, container_id: str):
+        """
+        cgroup 피크 메모리 카운터를 리셋하고 파일을 연 채로 반환 (리셋 불가 시 None)
+
+        cgroup v2의 memory.peak 리셋은 쓰기한 fd에만 적용되므로 exec 종료 후
+        같은 fd로 읽어야 함. 호출자가 close 책임
+        """
+        for path_template in _CGROUP_MEMORY_PEAK_PATHS:
+            try:
+                f = open(path_template.format(id=container_id), "r+b", buffering=0)
+            except OSError:
+                continue
+            try:
+                f.write(b"0")
+                return f
+            except OSError:
+                # 리셋 미지원 커널 / 권한 없음: 누적 피크는 이전 작업 값이 섞이므로 사용하지 않음
+                f.close()
+                return None
+        return None
+
+    def _measure_memory(self, container_id: str, peak_file=None) -> Optional[int]:
+        """
+        컨테이너 메모리 사용량 측정
+
+        exec 전에 리셋한 cgroup 피크 파일이 있으면 이번 작업의 피크를 읽고,
+        없으면 cgroup의 현재 사용량을 읽음. 둘 다 불가능한 경우에만
+        container.stats()로 fallback (stats는 CPU 샘플 2회 수집으로 약 1초 소요)
+        """
+        if peak_file is not None:
+            try:
+                peak_file.seek(0)
+                peak = int(peak_file.read())
+                logger.debug("Memory peak read from cgroup", container_id=container_id[:12], bytes=peak)
+                return peak
+            except (OSError, ValueError):
+                pass
+
+        for path_template in _CGROUP_MEMORY_USAGE_PATHS:
+            try:
+                with open(path_template.format(id=container_id), "rb") as f:
+                    usage = int(f.read())
+            except (OSError, ValueError):
+                continue
+            logger.debug("Memory usage read from cgroup", container_id=container_id[:12], bytes=usage)
+            return usage
+
         try:
-            container = self.client.containers.get(container_id)
+            container = self.warm_pool.get_container(container_id)
             stats = container.stats(stream=False)
 
             memory_stats = stats.get("memory_stats", {})
@@ -637,24 +918,25 @@ class DockerService:
             return "메모리 사용량 정보를 가져올 수 없습니다."
 
         allocated_mb = task.memory_mb or 128
-        allocated_bytes = allocated_mb * 1024 * 1024
-        ratio = peak_memory_bytes / allocated_bytes
-        peak_mb = peak_memory_bytes // (1024 * 1024)
+        allocated_bytes = allocated_mb << 20
+        peak_mb = peak_memory_bytes >> 20
 
-        if ratio < 0.3:
+        # 사용률(peak / allocated) 구간 비교를 정수 연산으로 수행
+        scaled_peak = peak_memory_bytes * 10
+        if scaled_peak < allocated_bytes * 3:
             recommended_mb = int(peak_mb * 1.5) or 1
             savings = (1.0 - recommended_mb / allocated_mb) * 100
             return (
                 f"💡 Tip: 현재 메모리 설정({allocated_mb}MB)에 비해 실제 사용량({peak_mb}MB)이 "
                 f"매우 낮습니다. 메모리를 {recommended_mb}MB 정도로 줄이면 비용을 약 {savings:.0f}% 절감할 수 있습니다."
             )
-        elif ratio < 0.7:
+        elif scaled_peak < allocated_bytes * 7:
             recommended_mb = int(peak_mb * 1.3) or 1
             return (
                 f"✅ Tip: 현재 메모리 설정({allocated_mb}MB)이 비교적 여유 있습니다(사용량: {peak_mb}MB). "
                 f"더 절감하려면 {recommended_mb}MB로 조정할 수 있습니다."
             )
-        elif ratio <= 1.0:
+        elif peak_memory_bytes <= allocated_bytes:
             return (
                 f"✅ Tip: 현재 메모리 설정({allocated_mb}MB)이 적절합니다. "
                 f"피크 사용량({peak_mb}MB)이 설정 범위 내에 있습니다."
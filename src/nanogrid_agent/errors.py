@@ -0,0 +1,15 @@
+"""
+에이전트 예외 정의
+
+실패 분류(로그의 [FAIL][...] 태그)는 예외 타입의 error_type으로 결정
+"""
+
+
+class AgentError(RuntimeError):
+    """에이전트 처리 실패 기본 예외"""
+    error_type = "UNKNOWN"
+
+
+class S3FetchError(AgentError):
+    """S3 코드 다운로드 / 작업 디렉터리 준비 실패"""
+    error_type = "S3"
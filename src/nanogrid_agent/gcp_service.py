@@ -4,48 +4,135 @@ GCP Storage 서비스
 코드를 GCP Cloud Storage에 저장
 """
 
+import functools
+import gzip
 import os
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Tuple
+
 import structlog
 
 from .config import AgentConfig
 
 logger = structlog.get_logger()
 
+# 프로세스 전역 GCS 클라이언트 캐시: (credentials_path, bucket_name) -> (client, bucket, credentials)
+# 서비스 인스턴스가 다시 만들어져도 커넥션 풀과 인증 토큰을 재사용
+# (credentials 객체가 액세스 토큰을 보관하고 만료 시에만 갱신)
+_CLIENT_CACHE: Dict[Tuple[str, str], tuple] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+HTTP_POOL_SIZE = 32  # 업로드 스레드 + 청크 병렬 업로드 워커를 수용하는 커넥션 수
+HTTP_MAX_RETRIES = 5
+
+
+def _create_http_session(credentials):
+    """
+    keep-alive 커넥션 풀과 재시도 정책을 가진 인증 세션 생성
+
+    기본 풀 크기(10)보다 동시 요청이 많으면 커넥션이 버려지고
+    매번 TCP/TLS 핸드셰이크가 발생하므로 풀 크기를 명시
+    """
+    from google.auth.transport.requests import AuthorizedSession
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = AuthorizedSession(credentials)
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=Retry(total=HTTP_MAX_RETRIES, backoff_factor=0.2),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+@functools.lru_cache(maxsize=4)
+def _load_service_account_credentials(credentials_path: str):
+    """
+    서비스 계정 키 파일에서 자격 증명 로드 (경로별 캐시, 서비스 인스턴스 간 공유)
+
+    파일이 없으면 FileNotFoundError (예외는 캐시되지 않으므로 나중에 마운트되면 다시 시도)
+    """
+    from google.cloud import storage
+    from google.oauth2 import service_account
+
+    return service_account.Credentials.from_service_account_file(
+        credentials_path, scopes=storage.Client.SCOPE
+    )
+
+
+def _create_client(credentials_path: str):
+    """자격 증명을 로드하고 풀링된 세션을 사용하는 (storage.Client, credentials) 생성"""
+    import google.auth
+    from google.cloud import storage
+
+    # credentials_path가 설정되어 있으면 해당 파일 사용 (존재 여부는 별도 stat 없이 로드 시 확인)
+    credentials = None
+    if credentials_path:
+        try:
+            credentials = _load_service_account_credentials(credentials_path)
+            logger.info(f"🔑 Using credentials from: {credentials_path}")
+            project = credentials.project_id
+        except FileNotFoundError:
+            pass
+
+    if credentials is None:
+        # 환경변수 GOOGLE_APPLICATION_CREDENTIALS 확인
+        env_creds = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS")
+        if env_creds:
+            logger.info(f"🔑 Using credentials from env: {env_creds}")
+        else:
+            logger.warning("⚠️ No credentials path configured, using default credentials")
+        credentials, project = google.auth.default(scopes=storage.Client.SCOPE)
+
+    return storage.Client(
+        project=project,
+        credentials=credentials,
+        _http=_create_http_session(credentials),
+    ), credentials
+
+
+def _get_storage_bucket(credentials_path: str, bucket_name: str):
+    """(자격 증명, 버킷)별 GCS 클라이언트/버킷 반환 (캐시)"""
+    key = (credentials_path, bucket_name)
+    with _CLIENT_CACHE_LOCK:
+        cached = _CLIENT_CACHE.get(key)
+        if cached is None:
+            client, credentials = _create_client(credentials_path)
+            cached = (client, client.bucket(bucket_name), credentials)
+            _CLIENT_CACHE[key] = cached
+            logger.info("GCP Storage initialized", bucket=bucket_name)
+        return cached
+
 
 class GcpStorageService:
     """GCP Cloud Storage에 코드 업로드"""
 
+    UPLOAD_WORKERS = 16
+    PARALLEL_UPLOAD_THRESHOLD = 8 * 1024 * 1024  # 이보다 크면 청크 병렬 업로드
+    PARALLEL_UPLOAD_CHUNK_SIZE = 16 * 1024 * 1024
+    PARALLEL_UPLOAD_WORKERS = 8
+
     def __init__(self, config: AgentConfig):
         self.config = config
         self._client = None
         self._bucket = None
+        self._credentials = None
+        # 업로드를 호출자 스레드와 분리하기 위한 스레드 풀
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.UPLOAD_WORKERS, thread_name_prefix="gcp-upload"
+        )
 
     def _get_bucket(self):
-        """GCP Storage bucket lazy 초기화"""
+        """GCP Storage bucket lazy 초기화 (프로세스 전역 캐시 사용)"""
         if self._bucket is None:
             try:
-                from google.cloud import storage
-                from google.oauth2 import service_account
-
-                # credentials_path가 설정되어 있으면 해당 파일 사용
-                credentials_path = self.config.gcp.credentials_path
-                if credentials_path and os.path.exists(credentials_path):
-                    logger.info(f"🔑 Using credentials from: {credentials_path}")
-                    credentials = service_account.Credentials.from_service_account_file(credentials_path)
-                    self._client = storage.Client(credentials=credentials)
-                else:
-                    # 환경변수 GOOGLE_APPLICATION_CREDENTIALS 확인
-                    env_creds = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS")
-                    if env_creds:
-                        logger.info(f"🔑 Using credentials from env: {env_creds}")
-                    else:
-                        logger.warning("⚠️ No credentials path configured, using default credentials")
-                    self._client = storage.Client()
-
-                bucket_name = self.config.gcp.bucket_name
-                logger.info(f"🔄 Getting GCP bucket...")
-                self._bucket = self._client.bucket(bucket_name)
-                logger.info("GCP Storage initialized", bucket=bucket_name)
+                self._client, self._bucket, self._credentials = _get_storage_bucket(
+                    self.config.gcp.credentials_path, self.config.gcp.bucket_name
+                )
             except ImportError:
                 logger.error("google-cloud-storage not installed. Run: pip install google-cloud-storage")
                 raise
@@ -54,6 +141,26 @@ class GcpStorageService:
                 raise
         return self._bucket
 
+    def warm_up(self) -> None:
+        """
+        클라이언트 생성 및 액세스 토큰 선발급
+
+        첫 업로드/다운로드가 인증 토큰 발급 지연을 부담하지 않도록 시작 시 호출.
+        실패해도 첫 요청 시 다시 시도되므로 경고만 남김
+        """
+        if not self.config.gcp.enabled:
+            return
+
+        try:
+            from google.auth.transport.requests import Request
+
+            self._get_bucket()
+            if not self._credentials.valid:
+                self._credentials.refresh(Request())
+            logger.info("GCP access token prefetched")
+        except Exception as e:
+            logger.warning("GCP warm-up failed (will retry on first request)", error=str(e))
+
     def upload_code(self, job_id: str, code: str, extension: str = "py") -> str:
         """
         코드를 GCP Storage에 업로드
@@ -70,42 +177,70 @@ class GcpStorageService:
             logger.debug("GCP Storage is disabled, skipping upload")
             return ""
 
-        logger.info("=" * 40)
-        logger.info("📤 Starting GCP Upload")
-        logger.info(f"  Job ID: {job_id}")
-        logger.info(f"  Extension: {extension}")
-        logger.info(f"  Code size: {len(code)} bytes")
-        logger.info("=" * 40)
+        blob_path = f"codes/{job_id}.{extension}"
+        logger.info("📤 Starting GCP Upload", job_id=job_id, blob_path=blob_path, size=len(code))
 
         try:
-            logger.info("🔄 Getting GCP bucket...")
             bucket = self._get_bucket()
-
-            blob_path = f"codes/{job_id}.{extension}"
-            logger.info(f"📁 Blob path: {blob_path}")
-
             blob = bucket.blob(blob_path)
 
-            logger.info("⬆️ Uploading to GCP Storage...")
-            blob.upload_from_string(code, content_type="text/plain")
-
-            gcs_uri = f"gs://{self.config.gcp.bucket_name}/{blob_path}"
+            # gzip 압축 후 업로드 (Content-Encoding: gzip)
+            # GCS가 다운로드 시 자동으로 압축 해제(decompressive transcoding)하므로
+            # download_code 등 기존 읽기 경로는 그대로 동작
+            compressed = gzip.compress(code.encode("utf-8"), compresslevel=6)
+            blob.content_encoding = "gzip"
 
-            logger.info("=" * 40)
-            logger.info("✅ GCP Upload SUCCESS")
-            logger.info(f"  GCS URI: {gcs_uri}")
-            logger.info("=" * 40)
+            if len(compressed) > self.PARALLEL_UPLOAD_THRESHOLD:
+                self._upload_chunks_concurrently(blob, compressed, "text/plain; charset=utf-8")
+            else:
+                blob.upload_from_string(compressed, content_type="text/plain; charset=utf-8")
 
+            gcs_uri = f"gs://{self.config.gcp.bucket_name}/{blob_path}"
+            logger.info(
+                "✅ GCP Upload SUCCESS",
+                job_id=job_id,
+                gcs_uri=gcs_uri,
+                compressed_size=len(compressed),
+            )
             return gcs_uri
 
         except Exception as e:
-            logger.error("=" * 40)
-            logger.error("❌ GCP Upload FAILED")
-            logger.error(f"  Job ID: {job_id}")
-            logger.error(f"  Error: {str(e)}")
-            logger.error("=" * 40)
+            logger.error("❌ GCP Upload FAILED", job_id=job_id, error=str(e))
             raise
 
+    def _upload_chunks_concurrently(self, blob, data: bytes, content_type: str) -> None:
+        """대용량 데이터를 XML multipart upload로 청크 병렬 업로드"""
+        from google.cloud.storage import transfer_manager
+
+        # transfer_manager는 파일 경로 기반이므로 임시 파일을 거쳐 업로드
+        fd, tmp_path = tempfile.mkstemp(prefix="nanogrid-gcs-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            transfer_manager.upload_chunks_concurrently(
+                tmp_path,
+                blob,
+                content_type=content_type,
+                chunk_size=self.PARALLEL_UPLOAD_CHUNK_SIZE,
+                # 프로세스 워커는 인증 세션을 pickle해야 하므로 스레드 워커 사용
+                worker_type=transfer_manager.THREAD,
+                max_workers=self.PARALLEL_UPLOAD_WORKERS,
+            )
+        finally:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def upload_code_async(self, job_id: str, code: str, extension: str = "py") -> "Future[str]":
+        """
+        upload_code를 백그라운드 스레드에서 실행
+
+        Returns:
+            업로드된 GCS URI를 결과로 갖는 Future (실패 시 예외 전달)
+        """
+        return self._executor.submit(self.upload_code, job_id, code, extension)
+
     def download_code(self, job_id: str, extension: str = "py") -> str:
         """
         GCP Storage에서 코드 다운로드
@@ -117,16 +252,31 @@ class GcpStorageService:
         Returns:
             코드 문자열
         """
+        return self.download_code_bytes(job_id, extension).decode("utf-8")
+
+    def download_code_bytes(self, job_id: str, extension: str = "py") -> bytes:
+        """
+        GCP Storage에서 코드를 바이트로 다운로드
+
+        파일로 바로 기록하는 경우 문자열 디코딩/재인코딩 복사를 피하기 위해 사용
+
+        Args:
+            job_id: 작업 ID
+            extension: 파일 확장자 (기본값: py)
+
+        Returns:
+            코드 바이트 (GCS가 gzip 압축을 해제한 원본)
+        """
         if not self.config.gcp.enabled:
             logger.warning("GCP Storage is disabled")
-            return ""
+            return b""
 
         try:
             bucket = self._get_bucket()
             blob_path = f"codes/{job_id}.{extension}"
             blob = bucket.blob(blob_path)
 
-            code = blob.download_as_text()
+            code = blob.download_as_bytes()
             logger.info(
                 "Code downloaded from GCP",
                 job_id=job_id,
@@ -143,10 +293,6 @@ class GcpStorageService:
             raise
 
     def close(self) -> None:
-        """리소스 정리"""
-        if self._client is not None:
-            try:
-                self._client.close()
-            except Exception:
-                pass
+        """업로드 스레드 풀 정리 (클라이언트는 프로세스 전역으로 공유되므로 유지)"""
+        self._executor.shutdown(wait=True)
 
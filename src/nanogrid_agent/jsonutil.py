@@ -0,0 +1,53 @@
+"""
+JSON 직렬화 유틸리티
+
+orjson이 설치되어 있으면 사용하고, 없으면 표준 json 모듈로 fallback
+"""
+
+import json
+import re
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson은 선택 의존성
+    orjson = None
+
+# orjson은 64비트 범위를 벗어나는 정수를 float으로 변환하므로 (정밀도 손실)
+# 19자리 이상 연속된 숫자가 있으면 표준 json으로 파싱 (문자열 내부 숫자는 오탐이지만 결과는 동일)
+_LONG_DIGITS = re.compile(r"\d{19}")
+_LONG_DIGITS_BYTES = re.compile(rb"\d{19}")
+
+
+def dumps(obj: Any) -> bytes:
+    """객체를 UTF-8 JSON bytes로 직렬화 (non-ASCII 문자는 이스케이프하지 않음)"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # orjson이 지원하지 않는 값 (64비트 초과 정수 등)은 표준 json으로 처리
+            pass
+    text = json.dumps(obj, ensure_ascii=False)
+    try:
+        return text.encode("utf-8")
+    except UnicodeEncodeError:
+        # 짝 없는 surrogate는 UTF-8로 인코딩할 수 없으므로 \uXXXX 이스케이프로 직렬화
+        return json.dumps(obj).encode("ascii")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    JSON 문자열/bytes 역직렬화
+
+    orjson 사용 시에도 결과는 표준 json과 동일하게 유지:
+    64비트 범위를 벗어날 수 있는 정수는 표준 json으로 정확히 파싱하고,
+    orjson이 거부하는 입력(NaN, 짝 없는 surrogate 등)은 표준 json으로 재시도
+    """
+    if orjson is not None:
+        pattern = _LONG_DIGITS_BYTES if isinstance(data, (bytes, bytearray)) else _LONG_DIGITS
+        if pattern.search(data) is None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(data)
@@ -5,8 +5,11 @@ EC2에서 백그라운드로 실행되는 에이전트
 """
 
 import argparse
-import signal
+import logging
+import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import docker
@@ -14,7 +17,25 @@ import structlog
 
 
 def configure_logging() -> None:
-    """구조화된 로깅 설정"""
+    """
+    구조화된 로깅 설정
+
+    LOG_LEVEL 환경 변수(기본값: INFO) 미만의 로그는 bound logger 단계에서
+    no-op으로 처리되어 이벤트 딕셔너리 생성/렌더링 비용이 들지 않음.
+    LOG_FORMAT=json이면 색상 콘솔 출력 대신 JSON 한 줄로 출력 (운영 환경용, 렌더링 비용 감소)
+    """
+    level = logging.getLevelName(os.getenv("LOG_LEVEL", "INFO").upper())
+    if not isinstance(level, int):
+        level = logging.INFO
+
+    # 비용이 큰 DEBUG 전용 작업을 건너뛸 수 있도록 패키지 stdlib 로거에도 레벨 반영
+    logging.getLogger("nanogrid_agent").setLevel(level)
+
+    if os.getenv("LOG_FORMAT", "console").lower() == "json":
+        renderer = structlog.processors.JSONRenderer()
+    else:
+        renderer = structlog.dev.ConsoleRenderer(colors=True)
+
     structlog.configure(
         processors=[
             structlog.stdlib.add_log_level,
@@ -22,15 +43,56 @@ def configure_logging() -> None:
             structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S"),
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
-            structlog.dev.ConsoleRenderer(colors=True),
+            renderer,
         ],
-        wrapper_class=structlog.stdlib.BoundLogger,
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         context_class=dict,
         logger_factory=structlog.PrintLoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
 
+def warm_connections(
+    config,
+    docker_client,
+    s3_client,
+    redis_publisher,
+    gcp_service=None,
+) -> None:
+    """
+    외부 의존성 연결을 시작 시 미리 수립
+
+    첫 작업이 DNS 조회 / TLS 핸드셰이크 / 인증 토큰 발급 비용을 모두 부담하지 않도록
+    각 연결을 병렬로 초기화 (소요 시간 = 가장 느린 의존성 기준).
+    실패해도 첫 요청 시 다시 연결되므로 경고만 남김
+    """
+    logger = structlog.get_logger()
+
+    tasks = {
+        "docker": docker_client.ping,
+        "redis": redis_publisher.warm_up,
+    }
+    if config.s3.code_bucket:
+        tasks["s3"] = lambda: s3_client.head_bucket(Bucket=config.s3.code_bucket)
+    if gcp_service is not None:
+        tasks["gcp"] = gcp_service.warm_up
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=len(tasks), thread_name_prefix="warm") as executor:
+        futures = {name: executor.submit(fn) for name, fn in tasks.items()}
+
+    failed = []
+    for name, future in futures.items():
+        try:
+            future.result()
+        except Exception as e:
+            failed.append(name)
+            logger.warning("Warm-up failed", target=name, error=str(e))
+
+    elapsed_ms = int((time.monotonic() - start) * 1000)
+    logger.info("Warm-up finished", elapsed_ms=elapsed_ms, failed=failed)
+
+
 def main(config_path: Optional[str] = None) -> int:
     """
     에이전트 메인 함수
@@ -61,13 +123,13 @@ def main(config_path: Optional[str] = None) -> int:
         logger.info(f"  Warm Pool: {'enabled' if config.warm_pool.enabled else 'disabled'}")
         logger.info(f"  GCP Storage: {'enabled' if config.gcp.enabled else 'disabled'}")
 
-        # Docker 클라이언트 초기화
-        docker_client = docker.from_env()
+        # Docker 클라이언트 초기화 (동시 요청이 keep-alive 커넥션 하나에 몰리지 않도록 풀 확장)
+        docker_client = docker.from_env(max_pool_size=64)
         logger.info("Docker client initialized")
 
         # 서비스 초기화
         from .docker_service import DockerService, WarmPoolManager
-        from .s3_service import S3CodeStorageService
+        from .s3_service import S3CodeStorageService, create_s3_client
         from .redis_publisher import RedisResultPublisher
         from .cloudwatch_publisher import CloudWatchMetricsPublisher
         from .gcp_service import GcpStorageService
@@ -77,8 +139,15 @@ def main(config_path: Optional[str] = None) -> int:
         warm_pool = WarmPoolManager(config, docker_client)
         warm_pool.initialize()
 
+        # 공유 S3 클라이언트: S3CodeStorageService와 warm-up이 함께 사용
+        # (자격 증명 조회 / 커넥션 풀을 1회만 초기화)
+        import boto3
+
+        aws_session = boto3.session.Session(region_name=config.aws.region)
+        s3_client = create_s3_client(config.aws.region, session=aws_session)
+
         # 서비스들
-        s3_service = S3CodeStorageService(config)
+        s3_service = S3CodeStorageService(config, s3_client=s3_client)
         docker_service = DockerService(config, docker_client, warm_pool)
         redis_publisher = RedisResultPublisher(config)
         cloudwatch_publisher = CloudWatchMetricsPublisher(config)
@@ -96,6 +165,9 @@ def main(config_path: Optional[str] = None) -> int:
         else:
             logger.info("⏭️ GCP Storage is disabled")
 
+        # 첫 작업 전에 외부 연결 수립 (GCP 클라이언트 생성 및 인증 토큰 발급 포함)
+        warm_connections(config, docker_client, s3_client, redis_publisher, gcp_service)
+
         # SQS Poller
         poller = SqsPoller(
             config=config,
@@ -106,24 +178,17 @@ def main(config_path: Optional[str] = None) -> int:
             gcp_service=gcp_service,
         )
 
-        # 시그널 핸들러 설정
-        def signal_handler(signum, frame):
-            logger.info(f"Received signal {signum}, shutting down...")
-            poller.stop()
-
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
-
         logger.info("=" * 50)
         logger.info("NanoGrid Agent is ready!")
         logger.info("=" * 50)
 
-        # 폴링 시작 (블로킹)
+        # 폴링 시작 (SIGTERM/SIGINT 수신 시까지 블로킹)
         poller.start()
 
         # 정리
         logger.info("Shutting down...")
         warm_pool.cleanup()
+        cloudwatch_publisher.close()
         redis_publisher.close()
         if gcp_service:
             gcp_service.close()
@@ -2,11 +2,18 @@
 데이터 모델 정의
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, Optional, Union
 
+from . import jsonutil
 
-@dataclass
+# 메시지/결과는 작업마다 생성되므로 slots로 인스턴스 __dict__ 생성 생략
+# (dataclass slots 옵션은 Python 3.10+에서만 지원)
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class TaskMessage:
     """
     SQS 메시지로 수신하는 작업 요청 DTO
@@ -46,6 +53,11 @@ class TaskMessage:
             input=data.get("input"),  # input 필드 추가
         )
 
+    @classmethod
+    def from_json(cls, body: Union[bytes, str]) -> "TaskMessage":
+        """SQS 메시지 본문(JSON)에서 TaskMessage 생성"""
+        return cls.from_dict(jsonutil.loads(body))
+
     def __str__(self) -> str:
         input_preview = str(self.input)[:50] + "..." if self.input and len(str(self.input)) > 50 else str(self.input)
         return (
@@ -55,7 +67,7 @@ class TaskMessage:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ExecutionResult:
     """
     Docker 컨테이너 실행 결과를 담는 DTO
@@ -95,6 +107,10 @@ class ExecutionResult:
 
         return result
 
+    def to_json(self) -> bytes:
+        """Redis 전송용 UTF-8 JSON bytes 변환 (orjson 사용 가능 시 C 구현으로 직렬화)"""
+        return jsonutil.dumps(self.to_dict())
+
     def __str__(self) -> str:
         return (
             f"ExecutionResult[requestId={self.request_id}, functionId={self.function_id}, "
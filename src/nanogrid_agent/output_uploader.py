@@ -4,31 +4,82 @@ Output 파일 업로더
 컨테이너 실행 후 생성된 파일을 S3에 자동 업로드
 """
 
+import io
+import os
 import shutil
+import tarfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List
 
-import boto3
 import docker
 import structlog
 
 from .config import AgentConfig
+from .s3_service import create_s3_client
 
 
 logger = structlog.get_logger()
 
 
+def _iter_regular_files(root_dir: str) -> Iterator[str]:
+    """
+    root_dir 아래의 일반 파일 경로를 재귀적으로 반환
+
+    os.scandir는 getdents의 d_type으로 파일/디렉터리를 구분하므로 대부분 항목별 stat이 필요 없음.
+    FIFO / 소켓 / 깨진 심볼릭 링크는 제외 (FIFO를 read하면 쓰는 쪽이 없어 무한 대기)
+    """
+    stack = [root_dir]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry.path
+                except OSError:
+                    continue
+
+
+class _ChunkStream(io.RawIOBase):
+    """bytes 청크 iterator를 읽기 전용 파일 객체로 감싸는 어댑터 (seek 불가)"""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        while not self._pending:
+            try:
+                self._pending = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
+        n = min(len(b), len(self._pending))
+        b[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+
 class OutputFileUploader:
     """Output Binding - 컨테이너 실행 후 생성된 파일을 S3에 자동 업로드"""
 
+    # 이보다 작은 파일은 TransferManager를 거치지 않고 단일 put_object로 업로드
+    SMALL_FILE_THRESHOLD = 5 * 1024 * 1024
+
     def __init__(
         self,
         config: AgentConfig,
         docker_client: docker.DockerClient,
+        s3_client=None,
     ):
         self.config = config
         self.docker_client = docker_client
-        self.s3_client = boto3.client("s3", region_name=config.aws.region)
+        # 주입된 클라이언트가 있으면 사용, 없으면 생성 (커넥션 풀은 동시 업로드 수보다 넉넉하게 설정됨)
+        self.s3_client = s3_client or create_s3_client(config.aws.region)
 
     def upload_output_files(self, request_id: str, container_id: str) -> List[str]:
         """
@@ -95,20 +146,11 @@ class OutputFileUploader:
             # docker cp equivalent
             bits, stat = container.get_archive(src_path)
 
-            # tar 아카이브를 임시 파일로 저장 후 추출
-            tar_path = dest_path / "output.tar"
-            with open(tar_path, "wb") as f:
-                for chunk in bits:
-                    f.write(chunk)
-
-            # tar 추출
-            import tarfile
-            with tarfile.open(tar_path, "r") as tar:
+            # tar 스트림을 임시 파일 없이 도착하는 대로 추출 (r|: 순차 스트림 모드)
+            stream = io.BufferedReader(_ChunkStream(bits), buffer_size=64 * 1024)
+            with tarfile.open(fileobj=stream, mode="r|") as tar:
                 tar.extractall(dest_path)
 
-            # tar 파일 삭제
-            tar_path.unlink(missing_ok=True)
-
             logger.debug("Copied files from container", dest=str(dest_path))
 
         except Exception as e:
@@ -130,25 +172,28 @@ class OutputFileUploader:
             if not output_dir.exists():
                 output_dir = source_dir
 
-            for file_path in output_dir.rglob("*"):
-                if file_path.is_file():
-                    relative_path = file_path.relative_to(output_dir)
-                    s3_key = f"{prefix}/{request_id}/{relative_path}"
-
-                    logger.info(
-                        "Uploading file to S3",
-                        file=str(file_path),
-                        s3_key=s3_key,
-                    )
-
-                    self.s3_client.upload_file(
-                        str(file_path),
-                        bucket,
-                        s3_key,
-                    )
-
-                    url = f"s3://{bucket}/{s3_key}"
-                    uploaded_urls.append(url)
+            # 업로드 대상 (파일 경로, S3 키) 목록 수집 (일반 파일만)
+            root_dir = str(output_dir)
+            uploads = []
+            for file_path in _iter_regular_files(root_dir):
+                relative_path = os.path.relpath(file_path, root_dir).replace(os.sep, "/")
+                uploads.append((file_path, f"{prefix}/{request_id}/{relative_path}"))
+
+            # 파일별 업로드를 스레드 풀에서 병렬 수행 (파일 수만큼 RTT 누적 방지)
+            max_workers = max(1, min(self.config.output.upload_concurrency, len(uploads)))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self._upload_file, file_path, bucket, s3_key): s3_key
+                    for file_path, s3_key in uploads
+                }
+                for future in as_completed(futures):
+                    s3_key = futures[future]
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error("Failed to upload file to S3", s3_key=s3_key, error=str(e))
+                        continue
+                    uploaded_urls.append(f"s3://{bucket}/{s3_key}")
 
             if uploaded_urls:
                 logger.info(
@@ -162,6 +207,19 @@ class OutputFileUploader:
 
         return uploaded_urls
 
+    def _upload_file(self, file_path: str, bucket: str, s3_key: str) -> None:
+        """단일 파일 S3 업로드 (작은 파일은 put_object, 큰 파일은 multipart 가능한 upload_file)"""
+        logger.info(
+            "Uploading file to S3",
+            file=file_path,
+            s3_key=s3_key,
+        )
+        if os.stat(file_path).st_size < self.SMALL_FILE_THRESHOLD:
+            with open(file_path, "rb") as f:
+                self.s3_client.put_object(Bucket=bucket, Key=s3_key, Body=f.read())
+        else:
+            self.s3_client.upload_file(file_path, bucket, s3_key)
+
     def _cleanup(self, path: Path) -> None:
         """임시 디렉터리 정리"""
         try:
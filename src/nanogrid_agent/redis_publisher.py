@@ -4,7 +4,6 @@ Redis 결과 발행 서비스
 실행 결과를 Redis Pub/Sub으로 전송
 """
 
-import json
 from datetime import timedelta
 
 import redis
@@ -20,6 +19,10 @@ logger = structlog.get_logger()
 class RedisResultPublisher:
     """Redis Pub/Sub을 통해 실행 결과를 Controller에게 전송"""
 
+    JOB_RESULT_TTL_SECONDS = 600
+    MIN_CONNECTIONS = 16
+    POOL_TIMEOUT_SECONDS = 10  # 모든 연결이 사용 중일 때 반환을 기다리는 최대 시간
+
     def __init__(self, config: AgentConfig):
         self.config = config
         self._client: redis.Redis = None
@@ -27,14 +30,26 @@ class RedisResultPublisher:
     def _get_client(self) -> redis.Redis:
         """Redis 클라이언트 lazy 초기화"""
         if self._client is None:
-            self._client = redis.Redis(
+            # keep-alive 커넥션 풀 + 주기적 health check로 일시 장애 후 재연결 비용 감소
+            # 워커 수만큼 동시 발행이 가능하도록 크기를 잡고, 그래도 부족하면 예외 대신 반환을 대기
+            pool = redis.BlockingConnectionPool(
                 host=self.config.redis.host,
                 port=self.config.redis.port,
                 password=self.config.redis.password or None,
-                decode_responses=True,
+                # 응답 문자열을 사용하지 않으므로 디코딩 생략 (bytes 그대로 송수신)
+                decode_responses=False,
+                max_connections=max(self.MIN_CONNECTIONS, self.config.polling.worker_count),
+                timeout=self.POOL_TIMEOUT_SECONDS,
+                socket_keepalive=True,
+                health_check_interval=30,
             )
+            self._client = redis.Redis(connection_pool=pool)
         return self._client
 
+    def warm_up(self) -> None:
+        """커넥션 풀에 연결을 미리 생성 (첫 결과 발행 시 연결 지연 제거)"""
+        self._get_client().ping()
+
     def publish_result(self, result: ExecutionResult) -> None:
         """
         실행 결과를 Redis Pub/Sub 채널로 전송
@@ -48,9 +63,8 @@ class RedisResultPublisher:
         try:
             client = self._get_client()
 
-            # JSON 직렬화
-            payload = result.to_dict()
-            json_message = json.dumps(payload, ensure_ascii=False)
+            # JSON 직렬화 (UTF-8 bytes로 바로 생성하여 재인코딩 생략)
+            json_message = result.to_json()
 
             logger.info(
                 "Publishing result to Redis",
@@ -59,8 +73,12 @@ class RedisResultPublisher:
                 redis_host=self.config.redis.host,
             )
 
-            # Redis Publish
-            subscriber_count = client.publish(channel, json_message)
+            # Publish + 결과 저장(비동기 모드 지원, TTL 10분)을 한 번의 왕복으로 전송
+            job_key = f"job:{request_id}"
+            pipe = client.pipeline(transaction=False)
+            pipe.publish(channel, json_message)
+            pipe.setex(job_key, timedelta(seconds=self.JOB_RESULT_TTL_SECONDS), json_message)
+            subscriber_count, _ = pipe.execute()
 
             if subscriber_count > 0:
                 logger.info(
@@ -75,10 +93,7 @@ class RedisResultPublisher:
                     request_id=request_id,
                 )
 
-            # 비동기 모드 지원: 결과를 Redis에 저장 (TTL 10분)
-            job_key = f"job:{request_id}"
-            client.setex(job_key, timedelta(seconds=600), json_message)
-            logger.info("Job result saved", key=job_key, ttl_seconds=600)
+            logger.info("Job result saved", key=job_key, ttl_seconds=self.JOB_RESULT_TTL_SECONDS)
 
         except Exception as e:
             logger.error(
@@ -111,6 +126,7 @@ class RedisResultPublisher:
         if self._client is not None:
             try:
                 self._client.close()
+                self._client.connection_pool.disconnect()
             except Exception:
                 pass
 
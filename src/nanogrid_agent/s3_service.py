@@ -4,27 +4,57 @@ S3 코드 저장소 서비스
 S3에서 코드 zip 다운로드 및 압축 해제
 """
 
+import io
+import os
 import shutil
 import zipfile
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Union
 
 import structlog
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from .config import AgentConfig
+from .errors import S3FetchError
 from .models import TaskMessage
 
 
 logger = structlog.get_logger()
 
+# S3 클라이언트 공통 설정: 넉넉한 keep-alive 커넥션 풀, adaptive 재시도, 짧은 연결 타임아웃
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    tcp_keepalive=True,
+    connect_timeout=3,
+    read_timeout=30,
+)
+
+
+def create_s3_client(region: str, session=None):
+    """S3_CLIENT_CONFIG가 적용된 S3 클라이언트 생성 (session 미지정 시 기본 세션)"""
+    if session is None:
+        return boto3.client("s3", region_name=region, config=S3_CLIENT_CONFIG)
+    return session.client("s3", region_name=region, config=S3_CLIENT_CONFIG)
+
+
+# 메모리 임계값을 넘는 대용량 zip을 파일로 스트리밍할 때의 읽기 단위
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class S3CodeStorageService:
     """S3 기반 코드 저장소 서비스"""
 
-    def __init__(self, config: AgentConfig):
+    # 압축 해제 크기가 이 이상이고 파일이 여러 개면 스레드 풀로 병렬 해제
+    PARALLEL_EXTRACT_THRESHOLD = 1024 * 1024
+
+    def __init__(self, config: AgentConfig, s3_client=None):
         self.config = config
-        self.s3_client = boto3.client("s3", region_name=config.aws.region)
+        # 공유 클라이언트가 주어지면 재사용 (자격 증명 조회 / 커넥션 풀 중복 방지)
+        self.s3_client = s3_client or create_s3_client(config.aws.region)
 
     def prepare_working_directory(self, task: TaskMessage) -> Path:
         """
@@ -51,14 +81,15 @@ class S3CodeStorageService:
             # 1. 작업 디렉터리 생성
             work_dir = self._create_working_directory(request_id)
 
-            # 2. S3에서 zip 다운로드
-            zip_path = self._download_from_s3(s3_bucket, s3_key, work_dir, request_id)
+            # 2. S3에서 zip 다운로드 (작은 zip은 메모리로)
+            zip_source = self._download_from_s3(s3_bucket, s3_key, work_dir, request_id)
 
             # 3. zip 압축 해제
-            self._extract_zip(zip_path, work_dir, request_id)
+            self._extract_zip(zip_source, work_dir, request_id)
 
-            # 4. zip 파일 삭제
-            zip_path.unlink(missing_ok=True)
+            # 4. zip 파일 삭제 (디스크로 받은 경우)
+            if isinstance(zip_source, Path):
+                zip_source.unlink(missing_ok=True)
 
             logger.info("Successfully prepared working directory", work_dir=str(work_dir))
             return work_dir
@@ -71,7 +102,7 @@ class S3CodeStorageService:
                 s3_key=s3_key,
                 error=str(e),
             )
-            raise RuntimeError(f"Failed to prepare working directory: {e}") from e
+            raise S3FetchError(f"Failed to prepare working directory: {e}") from e
 
     def _create_working_directory(self, request_id: str) -> Path:
         """작업 디렉터리 생성"""
@@ -88,48 +119,110 @@ class S3CodeStorageService:
 
     def _download_from_s3(
         self, bucket: str, key: str, work_dir: Path, request_id: str
-    ) -> Path:
-        """S3에서 zip 파일 다운로드"""
-        zip_path = work_dir / "code.zip"
+    ) -> Union[Path, io.BytesIO]:
+        """
+        S3에서 zip 파일 다운로드
 
-        logger.info(
-            "Downloading from S3",
-            s3_uri=f"s3://{bucket}/{key}",
-            dest=str(zip_path),
-        )
+        s3.inmemory_threshold 이하이면 BytesIO로 반환하여 디스크 쓰기/재읽기/삭제를 생략하고,
+        그보다 크면 이미 열린 응답 스트림을 work_dir/code.zip에 기록한 뒤 경로를 반환
+        (크기 확인용 추가 요청 없이 GET 한 번으로 처리)
+        """
+        logger.info("Downloading from S3", s3_uri=f"s3://{bucket}/{key}")
 
         try:
-            self.s3_client.download_file(bucket, key, str(zip_path))
-            file_size = zip_path.stat().st_size
-            logger.info("Downloaded zip file", size_bytes=file_size)
+            response = self.s3_client.get_object(Bucket=bucket, Key=key)
+            body = response["Body"]
+            size = response.get("ContentLength", 0)
+
+            if size <= self.config.s3.inmemory_threshold:
+                try:
+                    buffer = io.BytesIO(body.read())
+                finally:
+                    body.close()
+                logger.info("Downloaded zip file into memory", size_bytes=size)
+                return buffer
+
+            # 대용량: 메모리에 올리지 않고 청크 단위로 파일에 기록
+            zip_path = work_dir / "code.zip"
+            try:
+                with open(zip_path, "wb") as f:
+                    shutil.copyfileobj(body, f, _DOWNLOAD_CHUNK_SIZE)
+            finally:
+                body.close()
+            logger.info("Downloaded zip file", size_bytes=size, dest=str(zip_path))
             return zip_path
 
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "Unknown")
-            raise RuntimeError(
+            raise S3FetchError(
                 f"S3 download failed: s3://{bucket}/{key} - {error_code}"
             ) from e
 
-    def _extract_zip(self, zip_path: Path, target_dir: Path, request_id: str) -> None:
-        """zip 파일 압축 해제"""
-        logger.info("Extracting zip file", zip_path=str(zip_path), target_dir=str(target_dir))
+    def _extract_zip(
+        self, zip_path: Union[Path, io.BytesIO], target_dir: Path, request_id: str
+    ) -> None:
+        """zip 파일(경로 또는 메모리 버퍼) 압축 해제"""
+        logger.info(
+            "Extracting zip file",
+            zip_path=str(zip_path) if isinstance(zip_path, Path) else "<memory>",
+            target_dir=str(target_dir),
+        )
 
-        extracted_count = 0
+        target_root = str(target_dir.resolve())
         with zipfile.ZipFile(zip_path, "r") as zf:
-            for entry in zf.namelist():
-                # 디렉터리 순회 공격 방지
-                target_path = (target_dir / entry).resolve()
-                if not str(target_path).startswith(str(target_dir.resolve())):
-                    logger.warning("Suspicious zip entry, skipping", entry=entry)
+            # 디렉터리 순회 공격 방지: 대상 디렉터리 밖을 가리키는 엔트리 제외
+            safe_members: List[zipfile.ZipInfo] = []
+            for info in zf.infolist():
+                target_path = (target_dir / info.filename).resolve()
+                if not str(target_path).startswith(target_root):
+                    logger.warning("Suspicious zip entry, skipping", entry=info.filename)
                     continue
-
-                if entry.endswith("/"):
-                    target_path.mkdir(parents=True, exist_ok=True)
-                else:
-                    target_path.parent.mkdir(parents=True, exist_ok=True)
-                    with zf.open(entry) as src, open(target_path, "wb") as dst:
-                        dst.write(src.read())
-                    extracted_count += 1
-
+                safe_members.append(info)
+
+            file_members = [info for info in safe_members if not info.is_dir()]
+            total_size = sum(info.file_size for info in file_members)
+            workers = min(os.cpu_count() or 1, len(file_members))
+
+            if total_size < self.PARALLEL_EXTRACT_THRESHOLD or workers <= 1:
+                # ZipFile.extractall은 엔트리를 청크 단위로 스트리밍하여 기록
+                zf.extractall(target_dir, members=safe_members)
+            else:
+                # 디렉터리는 먼저 순차 생성 후 파일만 병렬 해제
+                for info in safe_members:
+                    if info.is_dir():
+                        zf.extract(info, target_dir)
+                    else:
+                        (target_dir / info.filename).parent.mkdir(parents=True, exist_ok=True)
+                self._extract_parallel(zip_path, file_members, target_dir, workers)
+
+        extracted_count = len(file_members)
         logger.info("Extracted files", count=extracted_count)
 
+    @staticmethod
+    def _extract_parallel(
+        zip_source: Union[Path, io.BytesIO],
+        members: List[zipfile.ZipInfo],
+        target_dir: Path,
+        workers: int,
+    ) -> None:
+        """
+        zip 엔트리를 스레드별로 나누어 병렬 해제
+
+        ZipFile 인스턴스는 스레드 안전하지 않으므로 워커마다 별도로 연다
+        (zlib 압축 해제와 파일 쓰기는 GIL을 해제하므로 스레드로 확장됨)
+        """
+        # 메모리 버퍼는 원본 bytes를 공유하는 BytesIO를 워커마다 생성
+        data = zip_source.getvalue() if isinstance(zip_source, io.BytesIO) else None
+
+        def extract_chunk(chunk: List[zipfile.ZipInfo]) -> None:
+            source = io.BytesIO(data) if data is not None else zip_source
+            with zipfile.ZipFile(source, "r") as zf:
+                for info in chunk:
+                    zf.extract(info, target_dir)
+
+        # 크기 순으로 정렬 후 라운드 로빈 분배하여 워커별 작업량 균등화
+        ordered = sorted(members, key=lambda info: info.file_size, reverse=True)
+        chunks = [ordered[i::workers] for i in range(workers)]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="unzip") as executor:
+            # list()로 소비하여 워커 예외를 호출자에게 전파
+            list(executor.map(extract_chunk, chunks))
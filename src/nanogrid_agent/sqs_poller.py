@@ -4,15 +4,21 @@ SQS Poller - 메시지 수신 및 처리
 SQS Long Polling으로 작업 메시지를 수신하고 처리
 """
 
+import functools
 import json
+import queue
+import signal
+import threading
 import time
-from typing import Optional
+from typing import Dict, List, Optional
 
 import boto3
 import structlog
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from .config import AgentConfig
+from .errors import AgentError
 from .models import TaskMessage, ExecutionResult
 from .s3_service import S3CodeStorageService
 from .docker_service import DockerService
@@ -26,6 +32,13 @@ logger = structlog.get_logger()
 class SqsPoller:
     """SQS Long Polling 기반 작업 수신 및 처리"""
 
+    MAX_WAIT_TIME_SECONDS = 20  # SQS long polling 최대 대기 시간
+    DELETE_BATCH_SIZE = 10  # DeleteMessageBatch 요청당 최대 항목 수
+    DELETE_FLUSH_INTERVAL_SECONDS = 0.2  # 첫 삭제 요청 후 배치 전송까지 최대 대기 시간
+    VISIBILITY_BATCH_SIZE = 10  # ChangeMessageVisibilityBatch 요청당 최대 항목 수
+    DEFAULT_PREFETCH_BATCHES = 3  # prefetch_count 미설정 시 버퍼 크기 (수신 배치 크기의 배수)
+    RECEIVER_JOIN_TIMEOUT_SECONDS = 1.0  # 종료 시 진행 중인 long polling을 기다리는 최대 시간
+
     def __init__(
         self,
         config: AgentConfig,
@@ -42,11 +55,58 @@ class SqsPoller:
         self.cloudwatch_publisher = cloudwatch_publisher
         self.gcp_service = gcp_service
 
-        self.sqs_client = boto3.client("sqs", region_name=config.aws.region)
+        # 수신 스레드 / 삭제 스레드가 커넥션 풀 대기 없이 keep-alive 연결을 재사용하도록 설정
+        self.sqs_client = boto3.client(
+            "sqs",
+            region_name=config.aws.region,
+            config=Config(
+                max_pool_connections=max(config.polling.worker_count * 2, 32),
+                retries={"mode": "adaptive", "max_attempts": 5},
+                tcp_keepalive=True,
+            ),
+        )
         self._running = False
+        # 폴러당 고정인 큐 URL (메시지마다 인자/버퍼 항목으로 전달하지 않음)
+        self._queue_url = config.sqs.queue_url
+
+        self._stop_event = threading.Event()
+
+        # 수신 스레드가 미리 받아둔 메시지 버퍼: 워커가 처리하는 동안 다음 수신을 진행 (가득 차면 수신 대기)
+        # 수신 배치 크기(SQS 호출당 최대 10개)와 별개로 조절하되, 한 번 수신한 배치는 모두 담을 수 있도록 배치 크기 이상으로 보정
+        # (너무 크면 버퍼 대기 중 visibility timeout을 소모하므로 제한된 크기 유지)
+        batch_size = max(1, config.sqs.max_number_of_messages)
+        prefetch_count = config.polling.prefetch_count or batch_size * self.DEFAULT_PREFETCH_BATCHES
+        self._prefetch_queue: "queue.Queue[dict]" = queue.Queue(
+            maxsize=max(batch_size, prefetch_count)
+        )
+        self._wait_time_seconds = config.sqs.wait_time_seconds
+        # 동시에 long polling하는 수신 스레드 수 (SQS는 호출당 최대 10개만 반환)
+        self._receiver_count = max(1, config.sqs.receiver_parallelism)
+        # 버퍼에서 메시지를 꺼내 처리하는 워커 수: 한 메시지의 Docker 실행이 다른 메시지를 막지 않도록 함
+        self._worker_count = max(1, config.polling.worker_count)
+        # 컨테이너 실행 단계 동시성 제한: I/O 단계(워커 수)와 독립적으로 조절
+        self._docker_concurrency = max(1, min(config.polling.docker_concurrency, self._worker_count))
+        self._docker_slots = threading.BoundedSemaphore(self._docker_concurrency)
+
+        # 수신 후 삭제 전까지의 메시지: receipt_handle -> visibility 만료 시각(monotonic)
+        # 별도 스레드가 만료 전에 visibility timeout을 연장하여 장시간 실행 중 재전달 방지
+        self._visibility_timeout = max(1, config.sqs.visibility_timeout_seconds)
+        self._inflight: Dict[str, float] = {}
+        self._inflight_lock = threading.Lock()
+        self._heartbeat_stop = threading.Event()
+
+        # 삭제 대기 중인 receipt_handle: 별도 스레드가 DeleteMessageBatch로 묶어 전송
+        self._delete_buffer: List[str] = []
+        self._delete_cond = threading.Condition()
+        self._delete_stopping = False
 
     def start(self) -> None:
-        """폴링 시작"""
+        """
+        폴링 시작 (stop() 호출 또는 SIGTERM/SIGINT 수신 시까지 블로킹)
+
+        메인 스레드에서 호출되면 SIGTERM/SIGINT 핸들러를 등록하여 stop()을 호출하고,
+        종료 시 이전 핸들러를 복원
+        """
         if not self.config.polling.enabled:
             logger.info("Polling is disabled")
             return
@@ -55,37 +115,148 @@ class SqsPoller:
         if not queue_url:
             logger.error("SQS Queue URL is not configured")
             return
-
-        logger.info("Starting SQS Poller", queue_url=queue_url)
+        self._queue_url = queue_url
+
+        # long polling 보장: 0이면 short polling으로 빈 응답을 연속 요청하게 됨
+        wait_time_seconds = self.config.sqs.wait_time_seconds
+        if not (1 <= wait_time_seconds <= self.MAX_WAIT_TIME_SECONDS):
+            logger.warning(
+                "Invalid sqs.wait_time_seconds, using long polling default",
+                configured=wait_time_seconds,
+                default=self.MAX_WAIT_TIME_SECONDS,
+            )
+            wait_time_seconds = self.MAX_WAIT_TIME_SECONDS
+        self._wait_time_seconds = wait_time_seconds
+
+        logger.info(
+            "Starting SQS Poller",
+            queue_url=queue_url,
+            wait_time_seconds=wait_time_seconds,
+            receivers=self._receiver_count,
+            workers=self._worker_count,
+            docker_concurrency=self._docker_concurrency,
+            prefetch=self._prefetch_queue.maxsize,
+        )
         self._running = True
+        self._stop_event.clear()
+
+        threads = [
+            threading.Thread(target=self._receive_loop, name=f"sqs-receiver-{i}", daemon=True)
+            for i in range(self._receiver_count)
+        ]
+        threads += [
+            threading.Thread(target=self._worker_loop, name=f"sqs-worker-{i}", daemon=True)
+            for i in range(self._worker_count)
+        ]
+        self._delete_stopping = False
+        delete_thread = threading.Thread(
+            target=self._delete_flush_loop, name="sqs-delete", daemon=True
+        )
+        delete_thread.start()
+        self._heartbeat_stop.clear()
+        heartbeat_thread = threading.Thread(
+            target=self._visibility_loop, name="sqs-visibility", daemon=True
+        )
+        heartbeat_thread.start()
+        for thread in threads:
+            thread.start()
+
+        previous_handlers = self._install_signal_handlers()
+        try:
+            # 시그널 핸들러가 실행될 수 있도록 타임아웃을 두고 대기
+            while not self._stop_event.wait(1.0):
+                pass
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+
+        # 워커는 처리 중인 메시지를 마칠 때까지 대기
+        receivers = threads[:self._receiver_count]
+        for thread in threads[self._receiver_count:]:
+            thread.join()
+
+        # 수신 스레드는 long polling(최대 wait_time_seconds) 중일 수 있으므로 잠깐만 대기 (daemon 스레드)
+        # 종료 후 도착한 메시지는 버퍼에 넣지 않으므로 visibility timeout 이후 재전달됨
+        for thread in receivers:
+            thread.join(self.RECEIVER_JOIN_TIMEOUT_SECONDS)
+
+        # 처리 중인 메시지가 모두 끝났으므로 visibility 연장 중지
+        self._heartbeat_stop.set()
+        heartbeat_thread.join()
+
+        # 처리하지 못한 버퍼 메시지는 삭제하지 않았으므로 visibility timeout 이후 재전달됨
+        abandoned = self._prefetch_queue.qsize()
+        if abandoned:
+            logger.info("Leaving prefetched messages for redelivery", count=abandoned)
+
+        # 남은 삭제 요청 전송 후 종료
+        with self._delete_cond:
+            self._delete_stopping = True
+            self._delete_cond.notify()
+        delete_thread.join()
+
+    def stop(self) -> None:
+        """폴링 중지"""
+        logger.info("Stopping SQS Poller...")
+        self._running = False
+        self._stop_event.set()
+
+    def _install_signal_handlers(self) -> Dict[int, object]:
+        """SIGTERM/SIGINT 수신 시 stop() 호출 (메인 스레드에서만 등록 가능, 이전 핸들러 반환)"""
+        if threading.current_thread() is not threading.main_thread():
+            return {}
+
+        def handle_signal(signum, frame):
+            logger.info("Received signal, shutting down...", signal=signum)
+            self.stop()
+
+        previous = {}
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            previous[signum] = signal.signal(signum, handle_signal)
+        return previous
+
+    def _receive_loop(self) -> None:
+        """수신 스레드: 버퍼에 여유가 있는 동안 계속 수신 (여러 스레드가 같은 버퍼를 채움)"""
+        # 루프마다 바뀌지 않는 설정/메서드 조회를 한 번만 수행
+        receive = functools.partial(
+            self.sqs_client.receive_message,
+            QueueUrl=self._queue_url,
+            MaxNumberOfMessages=self.config.sqs.max_number_of_messages,
+            WaitTimeSeconds=self._wait_time_seconds,
+            VisibilityTimeout=self._visibility_timeout,
+        )
+        put = self._prefetch_queue.put
+        delay = self.config.polling.fixed_delay_seconds
 
         while self._running:
             try:
-                self._poll_once()
-            except KeyboardInterrupt:
-                logger.info("Received interrupt signal, stopping...")
-                self.stop()
+                self._poll_once(receive, put)
             except Exception as e:
+                # 정상 경로는 long polling이 대기를 대신하므로 오류 시에만 지연
                 logger.error("Polling error (Agent continues)", error=str(e))
-                time.sleep(self.config.polling.fixed_delay_seconds)
+                time.sleep(delay)
 
-    def stop(self) -> None:
-        """폴링 중지"""
-        logger.info("Stopping SQS Poller...")
-        self._running = False
+    def _worker_loop(self) -> None:
+        """워커 스레드: 버퍼에서 메시지를 꺼내 처리"""
+        while self._running:
+            try:
+                message = self._prefetch_queue.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            self._process_message(message)
 
-    def _poll_once(self) -> None:
-        """한 번 폴링 수행"""
-        queue_url = self.config.sqs.queue_url
+    def _poll_once(self, receive, put) -> None:
+        """
+        한 번 폴링 수행 (수신한 메시지는 버퍼에 추가)
 
-        logger.debug("Polling SQS", queue_url=queue_url)
+        Args:
+            receive: 요청 인자가 바인딩된 receive_message
+            put: 프리페치 버퍼의 put
+        """
+        logger.debug("Polling SQS", queue_url=self._queue_url)
 
         try:
-            response = self.sqs_client.receive_message(
-                QueueUrl=queue_url,
-                MaxNumberOfMessages=self.config.sqs.max_number_of_messages,
-                WaitTimeSeconds=self.config.sqs.wait_time_seconds,
-            )
+            response = receive()
         except ClientError as e:
             logger.error("SQS receive failed", error=str(e))
             return
@@ -98,10 +269,22 @@ class SqsPoller:
 
         logger.info("Received messages", count=len(messages))
 
+        # 버퍼 대기 시간도 visibility timeout을 소모하므로 수신 즉시 연장 대상으로 등록
+        deadline = time.monotonic() + self._visibility_timeout
+        with self._inflight_lock:
+            for message in messages:
+                self._inflight[message.get("ReceiptHandle", "")] = deadline
+
         for message in messages:
-            self._process_message(queue_url, message)
+            # 버퍼가 가득 차면 워커가 꺼낼 때까지 대기 (backpressure)
+            while self._running:
+                try:
+                    put(message, timeout=1.0)
+                    break
+                except queue.Full:
+                    continue
 
-    def _process_message(self, queue_url: str, message: dict) -> None:
+    def _process_message(self, message: dict) -> None:
         """개별 SQS 메시지 처리"""
         message_body = message.get("Body", "")
         receipt_handle = message.get("ReceiptHandle", "")
@@ -109,46 +292,47 @@ class SqsPoller:
 
         try:
             # JSON 파싱
-            data = json.loads(message_body)
-            task = TaskMessage.from_dict(data)
+            task = TaskMessage.from_json(message_body)
 
             if not task.request_id:
                 logger.error("TaskMessage has no requestId")
-                self._delete_message(queue_url, receipt_handle)
+                self._enqueue_delete(receipt_handle)
                 return
 
-            start_time = time.time()
+            start_ns = time.monotonic_ns()
 
-            logger.info("=" * 30)
-            logger.info("Received task message")
-            logger.info(f"  Request ID: {task.request_id}")
-            logger.info(f"  Function ID: {task.function_id}")
-            logger.info(f"  Runtime: {task.runtime}")
-            logger.info(f"  S3 Location: s3://{task.s3_bucket}/{task.s3_key}")
-            logger.info("=" * 30)
+            logger.info(
+                "Received task message",
+                request_id=task.request_id,
+                function_id=task.function_id,
+                runtime=task.runtime,
+                s3_bucket=task.s3_bucket,
+                s3_key=task.s3_key,
+            )
 
             # S3에서 코드 다운로드
             work_dir = self.s3_service.prepare_working_directory(task)
             logger.info("Prepared working directory", work_dir=str(work_dir))
 
-            # Docker 실행
-            result = self.docker_service.run_task(task, work_dir)
+            # Docker 실행 (슬롯이 없으면 대기, 그동안 다른 워커는 다운로드/발행 계속 진행)
+            with self._docker_slots:
+                result = self.docker_service.run_task(task, work_dir)
 
-            total_time = int((time.time() - start_time) * 1000)
+            total_time = (time.monotonic_ns() - start_ns) // 1_000_000
 
             # 실행 결과 로그
-            logger.info("=" * 30)
-            logger.info(f"Execution result for {task.request_id}")
-            logger.info(f"  Exit Code: {result.exit_code}")
-            logger.info(f"  Duration: {result.duration_millis}ms")
-            logger.info(f"  Total Time: {total_time}ms")
-            logger.info(f"  Peak Memory: {result.peak_memory_bytes} bytes")
-            logger.info(f"  Success: {result.success}")
-            if result.optimization_tip:
-                logger.info(f"  Optimization Tip: {result.optimization_tip}")
-            logger.info("=" * 30)
-            logger.debug(f"Stdout:\n{result.stdout}")
-            logger.debug(f"Stderr:\n{result.stderr}")
+            logger.info(
+                "Execution result",
+                request_id=task.request_id,
+                exit_code=result.exit_code,
+                duration_ms=result.duration_millis,
+                total_time_ms=total_time,
+                peak_memory_bytes=result.peak_memory_bytes,
+                success=result.success,
+                optimization_tip=result.optimization_tip,
+            )
+            # 필터링된 레벨이면 포맷팅 없이 무시되도록 키-값으로 전달
+            logger.debug("Execution output", stdout=result.stdout, stderr=result.stderr)
 
             # CloudWatch 메트릭 전송
             if result.peak_memory_bytes:
@@ -159,37 +343,43 @@ class SqsPoller:
                 except Exception as e:
                     logger.warning("CloudWatch publish failed", error=str(e))
 
-            # Redis Publish
-            try:
-                self.redis_publisher.publish_result(result)
-                logger.info("✅ Result sent to Redis", request_id=task.request_id)
-            except Exception as e:
-                logger.error("❌ Redis publish failed", request_id=task.request_id, error=str(e))
-
-            # GCP에 코드 업로드 (활성화되고 실행 성공한 경우에만)
+            # 후처리 I/O: GCP 업로드와 SQS 삭제는 백그라운드로 수행 (워커는 완료를 기다리지 않음)
+            # 1. GCP에 코드 업로드 (활성화되고 실행 성공한 경우에만, 백그라운드)
             if self.gcp_service and result.success:
                 try:
                     # work_dir에서 코드 파일 읽기
                     code_content = self._read_code_from_workdir(work_dir, task.runtime)
                     if code_content:
-                        gcs_uri = self.gcp_service.upload_code(
+                        # 업로드 완료를 기다리지 않고 결과는 콜백에서 로깅
+                        future = self.gcp_service.upload_code_async(
                             task.request_id,
                             code_content,
                             extension=self._get_extension_for_runtime(task.runtime)
                         )
-                        logger.info("✅ Code uploaded to GCP", request_id=task.request_id, gcs_uri=gcs_uri)
+                        future.add_done_callback(
+                            functools.partial(self._on_gcp_upload_done, task.request_id)
+                        )
                 except Exception as e:
                     logger.warning("⚠️ GCP upload failed (continuing)", request_id=task.request_id, error=str(e))
             elif self.gcp_service and not result.success:
                 logger.info("⏭️ Skipping GCP upload (execution failed)", request_id=task.request_id)
 
-            # 메시지 삭제
-            self._delete_message(queue_url, receipt_handle)
+            # 2. Redis Publish
+            try:
+                self.redis_publisher.publish_result(result)
+                logger.info("✅ Result sent to Redis", request_id=task.request_id)
+            except Exception as e:
+                logger.error("❌ Redis publish failed", request_id=task.request_id, error=str(e))
+
+            # 3. 메시지 삭제 요청 (발행 이후에 요청하여 그 사이 프로세스가 종료되면 재전달되도록 함,
+            #    Redis 발행 결과와 무관하게 삭제, 배치 전송은 백그라운드)
+            self._enqueue_delete(receipt_handle)
+
             logger.info("[DONE][OK]", request_id=task.request_id)
 
         except json.JSONDecodeError as e:
             logger.error("[FAIL][JSON_PARSE] Message parsing failed", error=str(e))
-            self._delete_message(queue_url, receipt_handle)
+            self._enqueue_delete(receipt_handle)
 
         except ValueError as e:
             logger.error(
@@ -200,30 +390,135 @@ class SqsPoller:
             # 메시지 삭제하지 않음 (DLQ로 이동)
 
         except Exception as e:
-            error_type = "UNKNOWN"
-            error_msg = str(e)
-            if "NoSuchKey" in error_msg or "Not Found" in error_msg:
-                error_type = "S3"
-            elif "docker" in error_msg.lower() or "container" in error_msg.lower():
-                error_type = "DOCKER"
+            # 실패 분류는 예외 타입으로 결정 (AgentError 하위 클래스가 아니면 UNKNOWN)
+            error_type = e.error_type if isinstance(e, AgentError) else AgentError.error_type
 
             logger.error(
                 f"[FAIL][{error_type}] Execution error",
                 request_id=task.request_id if task else "unknown",
-                error=error_msg,
+                error=str(e),
             )
             # 메시지 삭제하지 않음 (재시도 가능)
 
-    def _delete_message(self, queue_url: str, receipt_handle: str) -> None:
-        """SQS 메시지 삭제"""
+        finally:
+            # 처리가 끝난 메시지는 더 이상 연장하지 않음 (삭제하지 않은 메시지는 만료 후 재전달)
+            self._release_inflight(receipt_handle)
+
+    def _on_gcp_upload_done(self, request_id: str, future) -> None:
+        """GCP 업로드 완료 콜백"""
+        try:
+            gcs_uri = future.result()
+            logger.info("✅ Code uploaded to GCP", request_id=request_id, gcs_uri=gcs_uri)
+        except Exception as e:
+            logger.warning("⚠️ GCP upload failed (continuing)", request_id=request_id, error=str(e))
+
+    def _enqueue_delete(self, receipt_handle: str) -> None:
+        """SQS 메시지 삭제 요청을 배치 버퍼에 추가"""
+        self._release_inflight(receipt_handle)
+        with self._delete_cond:
+            self._delete_buffer.append(receipt_handle)
+            # 첫 항목(타이머 시작) 또는 배치가 찬 경우 flush 스레드 깨움
+            if len(self._delete_buffer) in (1, self.DELETE_BATCH_SIZE):
+                self._delete_cond.notify()
+
+    def _release_inflight(self, receipt_handle: str) -> None:
+        """visibility 연장 대상에서 제외"""
+        with self._inflight_lock:
+            self._inflight.pop(receipt_handle, None)
+
+    def _visibility_loop(self) -> None:
+        """만료가 가까운 처리 중 메시지의 visibility timeout을 주기적으로 연장"""
+        timeout = self._visibility_timeout
+        interval = max(1.0, min(10.0, timeout / 3))
+        while not self._heartbeat_stop.wait(interval):
+            # 다음 확인 전에 만료될 수 있는 메시지를 미리 연장
+            threshold = time.monotonic() + interval + timeout / 3
+            with self._inflight_lock:
+                due = [
+                    receipt_handle
+                    for receipt_handle, deadline in self._inflight.items()
+                    if deadline <= threshold
+                ]
+            if due:
+                self._extend_visibility(due)
+
+    def _extend_visibility(self, receipt_handles: List[str]) -> None:
+        """ChangeMessageVisibilityBatch로 visibility timeout 연장 (10개 단위)"""
+        for start in range(0, len(receipt_handles), self.VISIBILITY_BATCH_SIZE):
+            chunk = receipt_handles[start:start + self.VISIBILITY_BATCH_SIZE]
+            new_deadline = time.monotonic() + self._visibility_timeout
+            try:
+                response = self.sqs_client.change_message_visibility_batch(
+                    QueueUrl=self._queue_url,
+                    Entries=[
+                        {
+                            "Id": str(i),
+                            "ReceiptHandle": receipt_handle,
+                            "VisibilityTimeout": self._visibility_timeout,
+                        }
+                        for i, receipt_handle in enumerate(chunk)
+                    ],
+                )
+            except Exception as e:
+                logger.warning("Failed to extend message visibility", count=len(chunk), error=str(e))
+                continue
+
+            with self._inflight_lock:
+                for success in response.get("Successful", []):
+                    receipt_handle = chunk[int(success["Id"])]
+                    if receipt_handle in self._inflight:
+                        self._inflight[receipt_handle] = new_deadline
+            for failure in response.get("Failed", []):
+                logger.warning(
+                    "Failed to extend message visibility",
+                    code=failure.get("Code"),
+                    error=failure.get("Message"),
+                )
+            logger.debug("Extended message visibility", count=len(response.get("Successful", [])))
+
+    def _delete_flush_loop(self) -> None:
+        """배치가 차거나 첫 요청 후 DELETE_FLUSH_INTERVAL_SECONDS가 지나면 DeleteMessageBatch 전송"""
+        cond = self._delete_cond
+        while True:
+            with cond:
+                while not self._delete_buffer and not self._delete_stopping:
+                    cond.wait()
+                if not self._delete_buffer:
+                    return
+
+                deadline = time.monotonic() + self.DELETE_FLUSH_INTERVAL_SECONDS
+                while len(self._delete_buffer) < self.DELETE_BATCH_SIZE and not self._delete_stopping:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    cond.wait(remaining)
+
+                batch = self._delete_buffer[:self.DELETE_BATCH_SIZE]
+                del self._delete_buffer[:self.DELETE_BATCH_SIZE]
+
+            self._delete_messages(batch)
+
+    def _delete_messages(self, receipt_handles: List[str]) -> None:
+        """SQS 메시지 배치 삭제"""
         try:
-            self.sqs_client.delete_message(
-                QueueUrl=queue_url,
-                ReceiptHandle=receipt_handle,
+            response = self.sqs_client.delete_message_batch(
+                QueueUrl=self._queue_url,
+                Entries=[
+                    {"Id": str(i), "ReceiptHandle": receipt_handle}
+                    for i, receipt_handle in enumerate(receipt_handles)
+                ],
             )
-            logger.debug("Message deleted from SQS")
-        except ClientError as e:
-            logger.error("Failed to delete message", error=str(e))
+        except Exception as e:
+            logger.error("Failed to delete messages", count=len(receipt_handles), error=str(e))
+            return
+
+        for failure in response.get("Failed", []):
+            logger.error(
+                "Failed to delete message",
+                code=failure.get("Code"),
+                error=failure.get("Message"),
+            )
+        logger.debug("Messages deleted from SQS", count=len(response.get("Successful", [])))
 
     def _get_extension_for_runtime(self, runtime: str) -> str:
         """런타임에 맞는 파일 확장자 반환"""
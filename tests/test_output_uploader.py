@@ -0,0 +1,68 @@
+"""
+OutputFileUploader 업로드 대상 수집 테스트
+
+일반 파일만 업로드하고 FIFO / 깨진 심볼릭 링크는 건너뛰는지 확인
+"""
+
+import os
+import threading
+
+import pytest
+
+pytest.importorskip("docker")
+pytest.importorskip("boto3")
+pytest.importorskip("structlog")
+
+from nanogrid_agent.config import AgentConfig  # noqa: E402
+from nanogrid_agent.output_uploader import OutputFileUploader  # noqa: E402
+
+
+class FakeS3Client:
+    """put_object / upload_file 호출 키 기록"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.keys = []
+
+    def put_object(self, Bucket, Key, Body):
+        with self._lock:
+            self.keys.append(Key)
+
+    def upload_file(self, Filename, Bucket, Key):
+        with self._lock:
+            self.keys.append(Key)
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires os.mkfifo")
+def test_upload_skips_fifo_and_broken_symlink(tmp_path):
+    output_dir = tmp_path / "output"
+    (output_dir / "nested").mkdir(parents=True)
+    (output_dir / "result.txt").write_text("ok")
+    (output_dir / "nested" / "data.csv").write_text("a,b")
+    os.mkfifo(output_dir / "pipe")
+    os.symlink(tmp_path / "missing", output_dir / "dangling")
+
+    config = AgentConfig.from_dict(
+        {"s3": {"user_data_bucket": "bucket"}, "output": {"s3_prefix": "outputs"}}
+    )
+    s3_client = FakeS3Client()
+    uploader = OutputFileUploader(config, docker_client=None, s3_client=s3_client)
+
+    # FIFO를 read하면 무한 대기하므로 별도 스레드에서 실행하고 제한 시간 내 종료 확인
+    result = {}
+    worker = threading.Thread(
+        target=lambda: result.update(urls=uploader._upload_to_s3("req-1", tmp_path)),
+        daemon=True,
+    )
+    worker.start()
+    worker.join(timeout=5)
+    assert not worker.is_alive(), "upload blocked on a non-regular file"
+
+    assert sorted(s3_client.keys) == [
+        "outputs/req-1/nested/data.csv",
+        "outputs/req-1/result.txt",
+    ]
+    assert sorted(result["urls"]) == [
+        "s3://bucket/outputs/req-1/nested/data.csv",
+        "s3://bucket/outputs/req-1/result.txt",
+    ]
@@ -0,0 +1,141 @@
+"""
+WarmPoolManager 재사용 / 보충 동작 테스트
+
+실제 Docker 대신 컨테이너 생성/삭제 횟수를 기록하는 가짜 클라이언트 사용
+"""
+
+import itertools
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("docker")
+pytest.importorskip("structlog")
+
+from nanogrid_agent.config import AgentConfig  # noqa: E402
+from nanogrid_agent.docker_service import RuntimeType, WarmPoolManager  # noqa: E402
+
+
+class FakeContainer:
+    def __init__(self, container_id: str):
+        self.id = container_id
+        self.fail_pause = False
+
+    def pause(self) -> None:
+        if self.fail_pause:
+            raise RuntimeError("container is not running")
+
+    def unpause(self) -> None:
+        pass
+
+
+class FakeDockerClient:
+    """containers.run / api.remove_container 호출 기록"""
+
+    def __init__(self):
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        self.created = []
+        self.removed = []
+        self.containers = SimpleNamespace(run=self._run, get=self._get)
+        self.api = SimpleNamespace(remove_container=self._remove)
+
+    def _run(self, **kwargs) -> FakeContainer:
+        with self._lock:
+            container = FakeContainer(f"{next(self._ids):064x}")
+            self.created.append(container.id)
+        return container
+
+    def _get(self, container_id: str) -> FakeContainer:
+        return FakeContainer(container_id)
+
+    def _remove(self, container_id: str, **kwargs) -> None:
+        with self._lock:
+            self.removed.append(container_id)
+
+
+def _wait_for_refill(manager: WarmPoolManager, timeout: float = 2.0) -> None:
+    """refill 스레드가 깨어 있는 동안 잠시 대기"""
+    deadline = time.monotonic() + timeout
+    while manager._refill_event.is_set() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.05)
+
+
+@pytest.fixture
+def manager():
+    config = AgentConfig.from_dict(
+        {"warm_pool": {"python_size": 2, "cpp_size": 0, "nodejs_size": 0, "go_size": 0}}
+    )
+    client = FakeDockerClient()
+    manager = WarmPoolManager(config, client)
+    manager.initialize()
+    yield manager, client
+    manager.cleanup()
+
+
+def test_sequential_acquire_release_creates_no_extra_containers(manager):
+    manager, client = manager
+    initial = len(client.created)
+
+    for _ in range(20):
+        container_id = manager.acquire_container(RuntimeType.PYTHON)
+        # 작업 실행 중 refill 스레드가 동작할 시간을 준 뒤 반환
+        _wait_for_refill(manager)
+        manager.release_container(RuntimeType.PYTHON, container_id)
+        _wait_for_refill(manager)
+
+    assert len(client.created) == initial
+    assert client.removed == []
+    assert len(manager.pools[RuntimeType.PYTHON]) == 2
+
+
+def test_concurrent_surplus_is_trimmed_to_target(manager):
+    manager, client = manager
+    acquired = [manager.acquire_container(RuntimeType.PYTHON) for _ in range(4)]
+    for container_id in acquired:
+        manager.release_container(RuntimeType.PYTHON, container_id)
+    _wait_for_refill(manager)
+
+    live = set(client.created) - set(client.removed)
+    assert len(manager.pools[RuntimeType.PYTHON]) == 2
+    assert len(live) == 2
+
+
+def test_failed_release_is_refilled(manager):
+    manager, client = manager
+    container_id = manager.acquire_container(RuntimeType.PYTHON)
+    # pause 실패(예: 컨테이너 종료)로 정리되면 전체 수가 목표보다 작아져 보충됨
+    manager.get_container(container_id).fail_pause = True
+    manager.release_container(RuntimeType.PYTHON, container_id)
+    _wait_for_refill(manager)
+
+    assert container_id in client.removed
+    assert len(manager.pools[RuntimeType.PYTHON]) == 2
+
+
+def test_failed_initialize_removes_created_containers():
+    config = AgentConfig.from_dict(
+        {"warm_pool": {"python_size": 2, "cpp_size": 1, "nodejs_size": 2, "go_size": 0}}
+    )
+    client = FakeDockerClient()
+    create = client.containers.run
+
+    def run(**kwargs):
+        if "-cpp-" in kwargs["name"]:
+            raise RuntimeError("image not found")
+        return create(**kwargs)
+
+    client.containers.run = run
+    manager = WarmPoolManager(config, client)
+    try:
+        with pytest.raises(RuntimeError):
+            manager.initialize()
+
+        assert len(client.created) == 4
+        assert sorted(client.removed) == sorted(client.created)
+        assert all(not pool for pool in manager.pools.values())
+    finally:
+        manager.cleanup()